@@ -0,0 +1,166 @@
+"""Optional numba kernels for OBJ face parsing, fan triangulation and
+streamline tracing.
+
+``scan_faces``, ``triangulate`` and ``advance_streamlines`` are None when
+numba is not installed or fails to compile; callers fall back to the numpy
+implementations in editor_window.
+"""
+import logging
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional
+    njit = None
+    prange = range
+
+# Argument types editor_window passes to the kernels
+SCAN_FACES_SIGNATURE = 'i8(u1[::1], i4[::1], i4[::1], i4[::1])'
+TRIANGULATE_SIGNATURE = ('void(i4[:, ::1], i4[:, ::1], i4[::1], i4[::1], '
+                         'f4[:, ::1], f4[:, ::1], f4[:, ::1], f4[:, ::1])')
+# Model positions are a strided view into the interleaved vertex records
+ADVANCE_STREAMLINES_SIGNATURE = 'void(f8[:, ::1], i8[:, ::1], f4[:, :], f8[::1], f8, f8[:, ::1], b1[::1])'
+
+def _scan_faces_kernel(buf, raw_v, raw_n, counts):
+    """Scan newline-separated 'f' records, writing each corner's raw 1-based
+    vertex/normal index (0 = missing) and each face's corner count; returns
+    the number of corners written, or -1 if the output arrays are too small"""
+    n = len(buf)
+    corner = 0
+    face = 0
+    i = 0
+    while i < n:
+        if face == len(counts):
+            return -1
+        i += 1  # The 'f' keyword
+        first = corner
+        while i < n and buf[i] != 10:
+            c = int(buf[i])
+            if c == 32 or c == 9 or c == 13:
+                i += 1
+                continue
+            
+            # One "v/vt/vn" token; fields are separated by '/'
+            if corner == len(raw_v):
+                return -1
+            field = 0
+            sign = 1
+            value = 0
+            v = 0
+            vn = 0
+            while i < n:
+                c = int(buf[i])
+                if c == 32 or c == 9 or c == 10 or c == 13:
+                    break
+                if c == 47:
+                    if field == 0:
+                        v = sign * value
+                    elif field == 2:
+                        vn = sign * value
+                    field += 1
+                    sign = 1
+                    value = 0
+                elif c == 45:
+                    sign = -1
+                elif 48 <= c <= 57:
+                    value = value * 10 + (c - 48)
+                i += 1
+            if field == 0:
+                v = sign * value
+            elif field == 2:
+                vn = sign * value
+            raw_v[corner] = v
+            raw_n[corner] = vn
+            corner += 1
+        counts[face] = corner - first
+        face += 1
+        i += 1  # The newline
+    return corner
+
+def _triangulate_kernel(faces_v, faces_n, counts, tri_offsets, verts, norms, out_v, out_n):
+    """Fan-triangulate faces into out_v/out_n; explicit loops so numba can compile it"""
+    for f in prange(len(counts)):
+        for i in range(1, counts[f] - 1):
+            t = 3 * (tri_offsets[f] + i - 1)
+            a = faces_v[f, 0]
+            b = faces_v[f, i]
+            c = faces_v[f, i + 1]
+            
+            # Face normal, used where the OBJ gives no 'vn' index
+            e1x = verts[b, 0] - verts[a, 0]
+            e1y = verts[b, 1] - verts[a, 1]
+            e1z = verts[b, 2] - verts[a, 2]
+            e2x = verts[c, 0] - verts[a, 0]
+            e2y = verts[c, 1] - verts[a, 1]
+            e2z = verts[c, 2] - verts[a, 2]
+            nx = e1y * e2z - e1z * e2y
+            ny = e1z * e2x - e1x * e2z
+            nz = e1x * e2y - e1y * e2x
+            length = (nx * nx + ny * ny + nz * nz) ** 0.5
+            if length > 0:
+                nx /= length
+                ny /= length
+                nz /= length
+            else:
+                nx, ny, nz = 0.0, 1.0, 0.0
+            
+            for k in range(3):
+                corner = 0 if k == 0 else i + k - 1
+                for axis in range(3):
+                    out_v[t + k, axis] = verts[faces_v[f, corner], axis]
+                n = faces_n[f, corner]
+                if n >= 0:
+                    for axis in range(3):
+                        out_n[t + k, axis] = norms[n, axis]
+                else:
+                    out_n[t + k, 0] = nx
+                    out_n[t + k, 1] = ny
+                    out_n[t + k, 2] = nz
+
+def _advance_streamlines_kernel(points, nearest, vertices, pressure, step_size, out, moving):
+    """Move each point one step along the pressure-weighted directions to its
+    nearest vertices; moving[s] is False where the velocity vanishes. A vertex
+    the point sits on has no direction and adds nothing"""
+    for s in prange(len(points)):
+        vx = 0.0
+        vy = 0.0
+        vz = 0.0
+        for j in range(nearest.shape[1]):
+            n = nearest[s, j]
+            dx = vertices[n, 0] - points[s, 0]
+            dy = vertices[n, 1] - points[s, 1]
+            dz = vertices[n, 2] - points[s, 2]
+            length = (dx * dx + dy * dy + dz * dz) ** 0.5
+            if length == 0:
+                continue
+            weight = pressure[n] / length
+            vx += dx * weight
+            vy += dy * weight
+            vz += dz * weight
+        
+        moving[s] = vx != 0 or vy != 0 or vz != 0
+        if moving[s]:
+            scale = step_size / (vx * vx + vy * vy + vz * vz) ** 0.5
+            out[s, 0] = points[s, 0] + vx * scale
+            out[s, 1] = points[s, 1] + vy * scale
+            out[s, 2] = points[s, 2] + vz * scale
+
+scan_faces = None
+triangulate = None
+advance_streamlines = None
+if njit is not None:
+    try:
+        # The explicit signatures compile the kernels here rather than on the
+        # first model load; cache=True keeps them on disk between runs
+        scan_faces = njit(SCAN_FACES_SIGNATURE, cache=True, boundscheck=False)(_scan_faces_kernel)
+        triangulate = njit(TRIANGULATE_SIGNATURE, cache=True, parallel=True,
+                           boundscheck=False)(_triangulate_kernel)
+    except Exception as e:
+        logging.getLogger('AeroCalculator').warning(
+            f"numba compile failed, using numpy OBJ parsing: {str(e)}")
+    try:
+        # No fastmath: the zero-length and zero-velocity tests must match the numpy path exactly
+        advance_streamlines = njit(ADVANCE_STREAMLINES_SIGNATURE, cache=True, parallel=True,
+                                   boundscheck=False)(_advance_streamlines_kernel)
+    except Exception as e:
+        logging.getLogger('AeroCalculator').warning(
+            f"numba compile failed, using numpy streamline tracing: {str(e)}")
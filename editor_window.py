@@ -1,24 +1,235 @@
-import sys
 import os
 import json
+import math
+import ctypes
+import hashlib
+import mmap
 import numpy as np
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                            QLabel, QDockWidget, QTreeWidget, QTreeWidgetItem,
-                           QSizePolicy, QDoubleSpinBox, QComboBox, QCheckBox,
-                           QGroupBox, QPushButton, QFormLayout, QToolBar,
-                           QToolButton, QMenu, QMessageBox, QTabWidget, QScrollArea)
-from PyQt6.QtCore import Qt, QSize, QSettings, QPoint, QByteArray
-from PyQt6.QtGui import QFont, QColor, QAction, QDrag
-from OpenGL.GL import *
-from OpenGL.GLU import *
+                           QDoubleSpinBox, QComboBox, QGroupBox, QPushButton,
+                           QFormLayout, QToolBar, QToolButton, QMenu,
+                           QMessageBox, QScrollArea)
+from PyQt6.QtCore import (Qt, QSettings, QTimer, QObject, QRunnable, QThreadPool,
+                          QSignalBlocker, pyqtSignal)
+from PyQt6.QtGui import QColor, QDrag
+# PyOpenGL checks glGetError after every call by default; skip that per-call
+# round trip. This has to be set before OpenGL.GL is first imported.
+import OpenGL
+OpenGL.ERROR_CHECKING = False
+OpenGL.ERROR_LOGGING = False
+from OpenGL.GL import (GLuint, glBegin, glBindBuffer, glBindTexture, glBindVertexArray,
+                       glBlendFunc, glBufferData, glBufferStorage, glBufferSubData,
+                       glClear, glClearColor, glColor4f, glColorPointer,
+                       glDeleteBuffers, glDeleteProgram, glDeleteTextures,
+                       glDeleteVertexArrays, glDisable, glDisableClientState,
+                       glDisableVertexAttribArray, glDrawArrays, glDrawElements,
+                       glEnable, glEnableClientState, glEnableVertexAttribArray, glEnd,
+                       glGenBuffers, glGenTextures, glGenVertexArrays,
+                       glGetAttribLocation, glGetString, glGetUniformLocation,
+                       glInterleavedArrays, glLightfv, glLineWidth, glLoadMatrixf,
+                       glMapBufferRange, glMaterialf, glMaterialfv, glMatrixMode,
+                       glMultiDrawArrays, glNormalPointer, glPixelStorei, glPopMatrix,
+                       glPushMatrix, glRotatef, glScalef, glTexCoordPointer,
+                       glTexImage1D, glTexParameteri, glTranslatef, glUniform1f,
+                       glUnmapBuffer, glUseProgram, glVertex3fv, glVertexAttribPointer,
+                       glVertexPointer, glViewport,
+                       GL_AMBIENT, GL_ARRAY_BUFFER, GL_BLEND, GL_BYTE, GL_C3F_V3F,
+                       GL_C4UB_V3F, GL_CLAMP_TO_EDGE, GL_COLOR_ARRAY,
+                       GL_COLOR_BUFFER_BIT, GL_COLOR_MATERIAL, GL_CULL_FACE,
+                       GL_DEPTH_BUFFER_BIT, GL_DEPTH_TEST, GL_DIFFUSE, GL_DYNAMIC_DRAW,
+                       GL_DYNAMIC_STORAGE_BIT, GL_ELEMENT_ARRAY_BUFFER, GL_FALSE,
+                       GL_FLOAT, GL_FRAGMENT_SHADER, GL_FRONT_AND_BACK, GL_LIGHT0,
+                       GL_LIGHTING, GL_LINEAR, GL_LINES, GL_LINE_LOOP,
+                       GL_MAP_COHERENT_BIT, GL_MAP_INVALIDATE_BUFFER_BIT,
+                       GL_MAP_PERSISTENT_BIT, GL_MAP_UNSYNCHRONIZED_BIT,
+                       GL_MAP_WRITE_BIT, GL_MODELVIEW, GL_NORMALIZE, GL_NORMAL_ARRAY,
+                       GL_ONE_MINUS_SRC_ALPHA, GL_POSITION, GL_PROJECTION, GL_RGB,
+                       GL_SHININESS, GL_SHORT, GL_SPECULAR, GL_SRC_ALPHA,
+                       GL_STATIC_DRAW, GL_TEXTURE, GL_TEXTURE_1D,
+                       GL_TEXTURE_COORD_ARRAY, GL_TEXTURE_MAG_FILTER,
+                       GL_TEXTURE_MIN_FILTER, GL_TEXTURE_WRAP_S, GL_TRIANGLES, GL_TRUE,
+                       GL_UNPACK_ALIGNMENT, GL_UNSIGNED_BYTE, GL_UNSIGNED_INT,
+                       GL_VERSION, GL_VERTEX_ARRAY, GL_VERTEX_SHADER)
 from OpenGL.GL import shaders
-from OpenGL.GL.ARB.vertex_buffer_object import *
 from PyQt6.QtOpenGLWidgets import QOpenGLWidget
 import logging
 from datetime import datetime
-from typing import Dict
 from dataclasses import dataclass
 
+# Compiled OBJ kernels, None when numba isn't installed
+from aero_obj_numba import scan_faces as _scan_faces_jit
+from aero_obj_numba import triangulate as _triangulate_jit
+from aero_obj_numba import advance_streamlines as _advance_streamlines_jit
+
+# Grid/axes line shaders. GLSL 1.20 keeps them usable in the compatibility
+# context, reading the camera from the fixed-function matrix stack.
+# Positions arrive as integer multiples of the grid spacing.
+_LINE_VERTEX_SHADER = """
+#version 120
+attribute vec3 aPos;
+attribute vec3 aCol;
+uniform float uSpacing;
+varying vec3 vCol;
+
+void main()
+{
+    vCol = aCol;
+    gl_Position = gl_ModelViewProjectionMatrix * vec4(aPos * uSpacing, 1.0);
+}
+"""
+
+_LINE_FRAGMENT_SHADER = """
+#version 120
+varying vec3 vCol;
+
+void main()
+{
+    gl_FragColor = vec4(vCol, 1.0);
+}
+"""
+
+# Editor stylesheets, kept at module level so they are built once
+_EDITOR_QSS = """
+QMainWindow {
+    background-color: #1e1e1e;
+}
+QDockWidget {
+    color: white;
+    font-size: 14px;
+}
+QDockWidget::title {
+    background: #2d2d2d;
+    padding: 8px;
+    border: 1px solid #3d3d3d;
+}
+QLabel {
+    color: white;
+    font-size: 13px;
+    padding: 4px;
+}
+QTreeWidget {
+    background-color: #2d2d2d;
+    color: white;
+    border: 1px solid #3d3d3d;
+    font-size: 13px;
+}
+QTreeWidget::item {
+    padding: 4px;
+}
+QTreeWidget::item:selected {
+    background-color: #0078d4;
+}
+QWidget {
+    background-color: #252526;
+}
+"""
+
+_TOOLBAR_QSS = """
+QToolBar {
+    background-color: rgba(45, 45, 45, 200);
+    border: 1px solid #3d3d3d;
+    border-radius: 6px;
+    padding: 6px;
+    spacing: 4px;
+}
+QToolButton {
+    color: white;
+    background-color: rgba(60, 60, 60, 180);
+    border: 1px solid #3d3d3d;
+    padding: 6px 12px;
+    border-radius: 4px;
+    min-width: 60px;
+    font-size: 12px;
+    font-weight: 500;
+}
+QToolButton:hover {
+    background-color: rgba(70, 70, 70, 180);
+    border: 1px solid rgba(255, 255, 255, 30);
+}
+QToolButton:checked {
+    background-color: rgba(0, 120, 212, 180);
+    border: 1px solid rgba(255, 255, 255, 40);
+}
+QToolButton::menu-indicator {
+    image: none;
+}
+QDoubleSpinBox {
+    background-color: rgba(60, 60, 60, 180);
+    color: white;
+    border: 1px solid #3d3d3d;
+    border-radius: 4px;
+    padding: 4px 8px;
+    min-width: 70px;
+    font-size: 12px;
+    selection-background-color: #0078d4;
+}
+QDoubleSpinBox:hover {
+    background-color: rgba(70, 70, 70, 180);
+    border: 1px solid rgba(255, 255, 255, 30);
+}
+QDoubleSpinBox::up-button, QDoubleSpinBox::down-button {
+    border: none;
+    background: transparent;
+    width: 16px;
+}
+QDoubleSpinBox::up-button:hover, QDoubleSpinBox::down-button:hover {
+    background-color: rgba(255, 255, 255, 20);
+}
+QMenu {
+    background-color: rgba(45, 45, 45, 230);
+    color: white;
+    border: 1px solid #3d3d3d;
+    border-radius: 4px;
+    padding: 4px;
+}
+QMenu::item {
+    padding: 6px 28px 6px 12px;
+    border-radius: 2px;
+}
+QMenu::item:selected {
+    background-color: rgba(0, 120, 212, 180);
+}
+QMenu::separator {
+    height: 1px;
+    background: #3d3d3d;
+    margin: 4px 8px;
+}
+"""
+
+_STATUSBAR_QSS = """
+QStatusBar {
+    color: white;
+    background-color: #2d2d2d;
+    padding: 4px;
+    font-size: 13px;
+}
+"""
+
+# Settings keys older versions stored at the root instead of the 'editor' group
+_LEGACY_SETTINGS_KEYS = (
+    'geometry', 'windowState', 'density', 'velocity', 'temperature', 'aoa',
+    'wind_size_x', 'wind_size_y', 'wind_pos_x', 'wind_pos_y', 'wind_pos_z',
+    'wind_rot_x', 'wind_rot_y', 'wind_rot_z',
+    'physicsPanelVisible', 'physicsPanelFloating', 'physicsPanelPos',
+)
+
+# Scroll areas wrapping the dock panels
+_SCROLL_QSS = """
+QScrollArea {
+    border: none;
+    background-color: transparent;
+}
+QScrollBar:vertical {
+    background-color: #2d2d2d;
+    width: 12px;
+}
+QScrollBar:horizontal {
+    background-color: #2d2d2d;
+    height: 12px;
+}
+"""
+
 @dataclass
 class FlowConditions:
     """Class to store flow conditions"""
@@ -34,10 +245,333 @@ class AerodynamicForces:
     lift: float  # Lift force (N)
     drag: float  # Drag force (N)
     moment: float  # Pitching moment (N·m)
-    pressure_distribution: Dict[int, float]  # Pressure at each vertex
+    pressure_distribution: np.ndarray  # Pressure coefficient at each vertex, by index
     cp: float  # Pressure coefficient
 
+def _to_bool(value):
+    """Convert a value read back from QSettings to a bool"""
+    # INI-backed settings return booleans as the strings 'true'/'false'
+    if isinstance(value, str):
+        return value.lower() == 'true'
+    return bool(value)
+
+def _gizmo_axes(length=2.0, head=0.2, spread=0.1):
+    """Interleaved [r, g, b, x, y, z] lines for the three gizmo arrows, followed
+    by a lighter highlight segment per axis"""
+    L, H, S = length, length - head, spread
+    return np.array([
+        # X axis (red) with arrow head
+        [1, 0, 0, 0, 0, 0], [1, 0, 0, L, 0, 0],
+        [1, 0, 0, L, 0, 0], [1, 0, 0, H, S, 0],
+        [1, 0, 0, L, 0, 0], [1, 0, 0, H, -S, 0],
+        # Y axis (green) with arrow head
+        [0, 1, 0, 0, 0, 0], [0, 1, 0, 0, L, 0],
+        [0, 1, 0, 0, L, 0], [0, 1, 0, S, H, 0],
+        [0, 1, 0, 0, L, 0], [0, 1, 0, -S, H, 0],
+        # Z axis (blue) with arrow head
+        [0, 0, 1, 0, 0, 0], [0, 0, 1, 0, 0, L],
+        [0, 0, 1, 0, 0, L], [0, 0, 1, S, 0, H],
+        [0, 0, 1, 0, 0, L], [0, 0, 1, -S, 0, H],
+        # Selected axis highlights, drawn one at a time
+        [1, 0.5, 0.5, 0, 0, 0], [1, 0.5, 0.5, L, 0, 0],
+        [0.5, 1, 0.5, 0, 0, 0], [0.5, 1, 0.5, 0, L, 0],
+        [0.5, 0.5, 1, 0, 0, 0], [0.5, 0.5, 1, 0, 0, L],
+    ], dtype=np.float32)
+
+_GIZMO_AXES = _gizmo_axes()
+# Vertices of the arrows themselves; the highlights follow them
+_GIZMO_ARROW_COUNT = 18
+# Gizmo X/Y/Z directions, one per row, for picking
+_GIZMO_AXIS_DIRS = np.identity(3)
+
+# Streamline vertex in GL_C4UB_V3F layout: RGBA bytes then float32 position
+_STREAMLINE_VERTEX = np.dtype([('col', np.uint8, 4), ('pos', np.float32, 3)])
+
+# File types load_model accepts from drag and drop
+_MODEL_EXTENSIONS = frozenset({'.obj', '.fbx'})
+
+# Model VBO storage/mapping flags for writing vertex edits without re-uploads
+_PERSISTENT_MAP_FLAGS = GL_MAP_WRITE_BIT | GL_MAP_PERSISTENT_BIT | GL_MAP_COHERENT_BIT
+# Dynamic storage keeps glBufferSubData usable if the persistent map fails
+_PERSISTENT_STORAGE_FLAGS = _PERSISTENT_MAP_FLAGS | GL_DYNAMIC_STORAGE_BIT
+# Whole-buffer rewrite of an orphaned VBO, no wait on draws still using the old storage
+_STREAM_MAP_FLAGS = GL_MAP_WRITE_BIT | GL_MAP_INVALIDATE_BUFFER_BIT | GL_MAP_UNSYNCHRONIZED_BIT
+
+# Packed grid/axes vertex: int16 position in grid units, padded to 4-byte
+# alignment, followed by normalized RGBA bytes
+_OVERLAY_VERTEX = np.dtype([('pos', np.int16, 3), ('pad', np.int16), ('col', np.uint8, 4)])
+
+# Model vertex: float32 position, a GL_BYTE normal (snorm, scaled by 127)
+# padded to 4 bytes, then the float32 pressure coefficient, 20 bytes per vertex
+_MODEL_VERTEX = np.dtype([('pos', np.float32, 3), ('nrm', np.int8, 3), ('pad', np.int8),
+                          ('cp', np.float32)])
+
+# Pressure color ramp as a 1D texture: blue (low), white, red (high). Linear
+# filtering between the texel centres, 1/6 and 5/6, is the blue-white-red blend
+_PRESSURE_RAMP = np.array([[0, 0, 255], [255, 255, 255], [255, 0, 0]], dtype=np.uint8)
+
+def _wind_arrows(width, height, arrow_count=5, arrow_length=1.0):
+    """GL_LINES vertices for an arrow_count x arrow_count grid of wind arrows
+    across a width x height plate, pointing along +z; (N, 3) float32"""
+    x, y = np.meshgrid(np.linspace(-0.5, 0.5, arrow_count) * width,
+                       np.linspace(-0.5, 0.5, arrow_count) * height, indexing='ij')
+    # Body plus the two head strokes, each drawn from the tip
+    offsets = np.array([[0.0, 0.0, 0.0], [0.0, 0.0, arrow_length],
+                        [0.0, 0.0, arrow_length], [-0.1, 0.0, arrow_length - 0.2],
+                        [0.0, 0.0, arrow_length], [0.1, 0.0, arrow_length - 0.2]])
+    bases = np.stack([x.ravel(), y.ravel(), np.zeros(x.size)], axis=1)
+    return (bases[:, None, :] + offsets).reshape(-1, 3).astype(np.float32)
+
+def _parse_obj_floats(lines):
+    """Parse the 'v'/'vn' records in lines into an (N, 3) float32 array"""
+    if not lines:
+        return np.zeros((0, 3), dtype=np.float32)
+    values = np.fromstring(b' '.join(line[2:] for line in lines), dtype=np.float32, sep=' ')
+    if len(values) != 3 * len(lines):
+        # Some records carry extra components (w, vertex colors); keep x, y, z
+        values = np.fromstring(b' '.join(b' '.join(line.split()[1:4]) for line in lines),
+                               dtype=np.float32, sep=' ')
+    return values.reshape(-1, 3)
+
+def _obj_indices(raw, count):
+    """Convert raw OBJ indices (1-based, negative = relative, 0 = missing) to 0-based, -1 if missing"""
+    raw = raw.astype(np.int64)
+    indices = np.where(raw < 0, count + raw, raw - 1).astype(np.int32)
+    indices[raw == 0] = -1
+    return indices
+
+def _raw_obj_indices(tokens):
+    """Integer values of OBJ index tokens, 0 where the token is empty"""
+    present = tokens != b''
+    raw = np.zeros(len(tokens), dtype=np.int64)
+    raw[present] = tokens[present].astype(np.int64)
+    return raw
+
+def _scan_obj_faces(lines):
+    """Split 'f' records into flat raw vertex/normal indices and per-face counts"""
+    if _scan_faces_jit is not None:
+        # Byte scanner: one pass over the joined records, no per-token objects
+        # The kernel signature takes a writable array; bytes would give a read-only one
+        buf = np.frombuffer(bytearray(b'\n'.join(lines)), dtype=np.uint8)
+        capacity = int(np.count_nonzero((buf == 32) | (buf == 9)))
+        raw_v = np.empty(capacity, dtype=np.int32)
+        raw_n = np.empty(capacity, dtype=np.int32)
+        counts = np.empty(len(lines), dtype=np.int32)
+        try:
+            total = _scan_faces_jit(buf, raw_v, raw_n, counts)
+            # -1: more tokens than whitespace bytes (e.g. '\r' separators); numpy copes
+            if total >= 0:
+                return raw_v[:total], raw_n[:total], counts
+        except Exception as e:
+            logging.getLogger('AeroCalculator').warning(
+                f"numba face scan failed, using numpy: {str(e)}")
+    
+    face_tokens = [line.split()[1:] for line in lines]
+    counts = np.fromiter(map(len, face_tokens), dtype=np.int32, count=len(face_tokens))
+    
+    # Split every "v/vt/vn" token at once
+    tokens = np.array([token for face in face_tokens for token in face])
+    v_part, _, rest = np.char.partition(tokens, b'/').T
+    _, _, n_part = np.char.partition(rest, b'/').T
+    return _raw_obj_indices(v_part), _raw_obj_indices(n_part), counts
+
+def _parse_obj_faces(lines, vertex_count, normal_count):
+    """Parse 'f' records into padded (faces, max_verts) vertex/normal index arrays and per-face counts"""
+    if not lines:
+        empty = np.zeros((0, 3), dtype=np.int32)
+        return empty, empty, np.zeros(0, dtype=np.int32)
+    raw_v, raw_n, counts = _scan_obj_faces(lines)
+    
+    # Scatter the flat token list into rows padded with -1
+    rows = np.repeat(np.arange(len(counts)), counts)
+    cols = np.arange(len(raw_v)) - np.repeat(np.cumsum(counts) - counts, counts)
+    faces_v = np.full((len(counts), counts.max()), -1, dtype=np.int32)
+    faces_n = np.full_like(faces_v, -1)
+    vert_idx = _obj_indices(raw_v, vertex_count)
+    norm_idx = _obj_indices(raw_n, normal_count)
+    # The triangulation kernel doesn't bounds-check, so reject bad indices here
+    if ((vert_idx < 0) | (vert_idx >= vertex_count)).any():
+        raise ValueError(f"OBJ face references a vertex outside 1..{vertex_count}")
+    if ((norm_idx < -1) | (norm_idx >= normal_count)).any():
+        raise ValueError(f"OBJ face references a normal outside 1..{normal_count}")
+    faces_v[rows, cols] = vert_idx
+    faces_n[rows, cols] = norm_idx
+    return faces_v, faces_n, counts
+
+def _triangulate_numpy(faces_v, faces_n, counts, tri_offsets, verts, norms):
+    """Fan-triangulate faces into flat vertex/normal arrays (numpy path)"""
+    if faces_v.shape[1] == 3 and (counts == 3).all():
+        # Pure triangle mesh: the face rows already are the triangles
+        face = np.arange(len(counts))
+        corners = np.array([[0, 1, 2]])
+    else:
+        tri_counts = np.maximum(counts - 2, 0)
+        face = np.repeat(np.arange(len(counts)), tri_counts)
+        fan = np.arange(len(face)) - np.repeat(tri_offsets, tri_counts) + 1
+        corners = np.stack([np.zeros_like(fan), fan, fan + 1], axis=1)
+    
+    vert_idx = faces_v[face[:, None], corners]
+    out_v = verts[vert_idx]
+    
+    out_v = out_v.reshape(-1, 3)
+    
+    norm_idx = faces_n[face[:, None], corners].ravel() if (faces_n >= 0).any() else None
+    if norm_idx is not None and (norm_idx >= 0).all():
+        # Every corner references a 'vn'; no face normals needed
+        return out_v, norms[norm_idx]
+    
+    # Face normals, batched over all triangles, for corners without a 'vn'
+    v1, v2, v3 = out_v[0::3], out_v[1::3], out_v[2::3]
+    face_normal = np.cross(v2 - v1, v3 - v1)
+    length = np.linalg.norm(face_normal, axis=1, keepdims=True)
+    face_normal = np.where(length > 0, face_normal / np.maximum(length, 1e-20),
+                           np.array([0.0, 1.0, 0.0], dtype=np.float32))
+    out_n = np.repeat(face_normal, 3, axis=0).astype(np.float32)
+    if norm_idx is not None:
+        has_normal = norm_idx >= 0
+        out_n[has_normal] = norms[norm_idx[has_normal]]
+    return out_v, out_n
+
+def _triangulate(faces_v, faces_n, counts, verts, norms):
+    """Fan-triangulate padded faces into flat (N, 3) float32 vertex and normal arrays"""
+    tri_counts = np.maximum(counts - 2, 0)
+    tri_offsets = (np.cumsum(tri_counts) - tri_counts).astype(np.int32)
+    if _triangulate_jit is not None:
+        total = 3 * int(tri_counts.sum())
+        out_v = np.empty((total, 3), dtype=np.float32)
+        out_n = np.empty((total, 3), dtype=np.float32)
+        try:
+            _triangulate_jit(faces_v, faces_n, counts, tri_offsets,
+                             np.ascontiguousarray(verts), np.ascontiguousarray(norms), out_v, out_n)
+            return out_v, out_n
+        except Exception as e:
+            # A failed JIT compile shouldn't stop the model from loading
+            logging.getLogger('AeroCalculator').warning(
+                f"numba triangulation failed, using numpy: {str(e)}")
+    return _triangulate_numpy(faces_v, faces_n, counts, tri_offsets, verts, norms)
+
+def _parse_obj(data):
+    """Parse OBJ file contents into triangulated (N, 3) float32 vertex and normal arrays"""
+    # The keyword is the first whitespace-delimited token, so allow indentation and tabs
+    lines = [line.lstrip() for line in data.splitlines()]
+    verts = _parse_obj_floats([line for line in lines if line.startswith((b'v ', b'v\t'))])
+    norms = _parse_obj_floats([line for line in lines if line.startswith((b'vn ', b'vn\t'))])
+    faces_v, faces_n, counts = _parse_obj_faces(
+        [line for line in lines if line.startswith((b'f ', b'f\t'))], len(verts), len(norms))
+    return _triangulate(faces_v, faces_n, counts, verts, norms)
+
+def _index_vertices(records):
+    """Merge identical vertex records; returns the unique records in order of
+    first use and the uint32 index of each original record"""
+    keys = records.view(np.uint32).reshape(len(records), -1)
+    _, first, inverse = np.unique(keys, axis=0, return_index=True, return_inverse=True)
+    # np.unique sorts; keep the mesh order so the GPU vertex cache stays effective
+    order = np.argsort(first)
+    remap = np.empty_like(order)
+    remap[order] = np.arange(len(order))
+    return records[first[order]], remap[inverse.reshape(-1)].astype(np.uint32)
+
+def _build_model_arrays(data):
+    """Parse OBJ bytes into a centered, scaled _MODEL_VERTEX array of unique
+    vertices and a uint32 triangle index array"""
+    vertices_array, normals_array = _parse_obj(data)
+    if len(vertices_array) == 0:
+        raise ValueError("OBJ file contains no faces")
+
+    # Center and scale the model
+    lo = vertices_array.min(axis=0)
+    hi = vertices_array.max(axis=0)
+    center = (hi + lo) / 2
+    max_size = np.max(hi - lo)
+    scale = 5.0 / max_size if max_size > 0 else 1.0
+    
+    # Interleave positions, normals and colors so each vertex is one record;
+    # the transform writes straight into it without temporaries
+    interleaved = np.zeros(len(vertices_array), dtype=_MODEL_VERTEX)
+    positions = interleaved['pos']
+    np.subtract(vertices_array, center, out=positions)
+    np.multiply(positions, np.float32(scale), out=positions)
+    # Normals are bounded to [-1, 1], so a signed byte each is plenty
+    interleaved['nrm'] = np.clip(np.rint(normals_array * 127), -127, 127)
+    
+    # Corners shared between triangles become one vertex plus indices
+    return _index_vertices(interleaved)
+
+def _ray_aabb(origin, direction, lo, hi):
+    """Slab test of a ray against one or more boxes; returns the entry distance
+    per box (0 if the origin is inside), inf where the ray misses"""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        inv = 1.0 / direction
+        t0 = (lo - origin) * inv
+        t1 = (hi - origin) * inv
+        t_near = np.maximum(np.nanmax(np.minimum(t0, t1), axis=-1), 0.0)
+        t_far = np.nanmin(np.maximum(t0, t1), axis=-1)
+    return np.where(t_far >= t_near, t_near, np.inf)
+
+def _ray_triangles(origin, direction, tris):
+    """Nearest hit distance of a ray against (N, 3, 3) triangles, None on a miss"""
+    e1 = tris[:, 1] - tris[:, 0]
+    e2 = tris[:, 2] - tris[:, 0]
+    p = np.cross(direction, e2)
+    det = np.einsum('ij,ij->i', e1, p)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        inv = 1.0 / det
+        s = origin - tris[:, 0]
+        u = np.einsum('ij,ij->i', s, p) * inv
+        q = np.cross(s, e1)
+        v = (q @ direction) * inv
+        t = np.einsum('ij,ij->i', e2, q) * inv
+    hit = (np.abs(det) > 1e-12) & (u >= 0) & (v >= 0) & (u + v <= 1) & (t >= 0)
+    return float(t[hit].min()) if hit.any() else None
+
+def _surface_area(tris):
+    """Total area of (T, 3, 3) triangles"""
+    cross = np.cross(tris[:, 1] - tris[:, 0], tris[:, 2] - tris[:, 0])
+    return float(np.linalg.norm(cross, axis=1).sum() / 2)
+
+class ObjLoadSignals(QObject):
+    """Signals emitted by ObjLoadWorker, delivered on the GUI thread"""
+    finished = pyqtSignal(int, str, str, object)  # token, path, content hash, (vertices, indices) or None
+    failed = pyqtSignal(int, str, str)  # token, path, error message
+
+class ObjLoadWorker(QRunnable):
+    """Read and parse an OBJ file on a thread pool thread"""
+    def __init__(self, token, file_path, loaded_hash=None):
+        super().__init__()
+        self.token = token
+        self.file_path = file_path
+        self.loaded_hash = loaded_hash
+        self.signals = ObjLoadSignals()
+
+    def run(self):
+        try:
+            with open(self.file_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    raise ValueError("OBJ file is empty")
+                # Map the file so hashing reads it in place; it is only copied if parsed
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    model_hash = hashlib.sha1(mm).hexdigest()
+                    
+                    # Same contents as the mesh already on the GPU: nothing to parse
+                    model = None if model_hash == self.loaded_hash else _build_model_arrays(mm[:])
+            self.signals.finished.emit(self.token, self.file_path, model_hash, model)
+        except Exception as e:
+            self.signals.failed.emit(self.token, self.file_path, str(e))
+
+class TriangulateWarmup(QRunnable):
+    """Run the numba kernel once on a single triangle so its cache and thread
+    pool are loaded before the first real model"""
+    def run(self):
+        faces = np.array([[0, 1, 2]], dtype=np.int32)
+        _triangulate(faces, np.full_like(faces, -1), np.array([3], dtype=np.int32),
+                     np.eye(3, dtype=np.float32), np.zeros((0, 3), dtype=np.float32))
+
 class Viewport(QOpenGLWidget):
+    # Grid/axes VBOs shared by every viewport, keyed by grid_size (spacing is
+    # applied in the shader).
+    # Each entry is [buffer, user count]; relies on AA_ShareOpenGLContexts.
+    _overlay_cache = {}
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setAcceptDrops(True)
@@ -45,14 +579,34 @@ class Viewport(QOpenGLWidget):
         self.last_pos = None
         self.show_grid = True
         self.show_axes = True
-        self.grid_size = 10
-        self.grid_spacing = 1.0
+        self._grid_size = 10
+        self._grid_spacing = 1.0
+        # Grid and axes share one line VBO drawn by a small shader program;
+        # it is rebuilt only when grid size/spacing change
+        self.line_program = None
+        self.vbo_overlay = None
+        self.vao_overlay = None
+        self.vbo_gizmo = None
+        self._overlay_key = None
+        self.grid_vertex_count = 0
+        self.axes_vertex_count = 0
+        self._overlay_dirty = True
         self.zoom = 15.0
         self.zoom_speed = 0.1
         self.min_zoom = 0.1
         self.max_zoom = 100.0
-        self.model_vertices = []
-        self.model_normals = []
+        # Always an (N, 3) float32 array; a view into model_interleaved once loaded
+        self.model_vertices = np.zeros((0, 3), dtype=np.float32)
+        # Content hash of the mesh currently on the GPU, used to skip re-uploads
+        self._model_hash = None
+        # Incremented per load request so results of superseded loads are dropped
+        self._load_token = 0
+        self.model_normals = np.zeros((0, 3), dtype=np.int8)
+        # Model translation, applied as a transform so the VBO stays untouched
+        self.model_position = np.zeros(3, dtype=np.float32)
+        # Per-triangle bounds for picking, set on upload
+        self._tri_lo = None
+        self._tri_hi = None
         self.model_loaded = False
         self.current_model_path = None
         # Add transform mode attributes
@@ -66,10 +620,51 @@ class Viewport(QOpenGLWidget):
         self.orbiting = False
         self.panning = False
         self.pan_offset = [0.0, 0.0]
-        # Vertex buffer objects
-        self.vbo_vertices = None
-        self.vbo_normals = None
+        # Vertex buffer of interleaved _MODEL_VERTEX records plus its triangle indices
+        self.vbo_model = None
+        self.ebo_model = None
+        self.vao_model = None
+        # Persistent write mapping of vbo_model, when buffer storage is supported
+        self.vbo_is_persistent = False
+        self._model_map = None
+        # Set when vbo_model was allocated with glBufferStorage and can't be orphaned
+        self.vbo_is_immutable = False
+        # Last GL state set through _set_lighting/_set_line_width
+        self._gl_state = {'lighting': None, 'line_width': None}
+        self.model_interleaved = None
+        self.model_indices = None
+        # Streamline segments, traced once per pressure/model change
+        self.vbo_streamlines = None
+        self._streamlines_capacity = 0
+        self.streamline_vertex_count = 0
+        # Wind source plate and the last pressure distribution, None until created/calculated
+        self.wind_plate = None
+        self.pressure_data = None
+        # Pressure ramp texture and the texture matrix mapping cp onto it;
+        # no matrix means no pressure has been shown on this model yet
+        self.tex_pressure = None
+        self._cp_matrix = None
+        # Wind direction arrows, uploaded when the wind plate is (re)created
+        self.vbo_wind_arrows = None
+        self._wind_arrows_capacity = 0
+        self._wind_arrows_dirty = False
+        self._streamlines_dirty = True
+        # Nearest-vertex lookup and per-vertex pressure for the flow field, built lazily
+        self._vertex_kdtree = None
+        self._pressure_vec = None
         self.vertex_count = 0
+        self.index_count = 0
+        
+        # Redraw only when the scene changed; the framebuffer is kept between
+        # paints so an unchanged frame can be skipped entirely
+        self._dirty = True
+        self.setUpdateBehavior(QOpenGLWidget.UpdateBehavior.PartialUpdate)
+        
+        # Coalesces high-rate mouse motion into at most one paint per ~60Hz frame
+        self._paint_timer = QTimer(self)
+        self._paint_timer.setInterval(16)
+        self._paint_timer.setSingleShot(True)
+        self._paint_timer.timeout.connect(self.update)
         
         # Set up OpenGL format
         format = self.format()
@@ -77,6 +672,7 @@ class Viewport(QOpenGLWidget):
         format.setStencilBufferSize(8)
         format.setVersion(2, 1)
         format.setProfile(format.OpenGLContextProfile.CompatibilityProfile)
+        format.setSwapInterval(1)  # Sync buffer swaps to vblank
         self.setFormat(format)
         
         # Set up logging
@@ -90,8 +686,26 @@ class Viewport(QOpenGLWidget):
         self.pan_offset = [0.0, 0.0]
         self.rotation = [30, 45, 0]  # Initial rotation angles
         
+        # Cached camera modelview, rebuilt only when rotation/zoom/pan change
+        self._mv = np.identity(4, dtype=np.float32)
+        self._mv_dirty = True
+        # Screen right/up directions for panning and gizmo drags, rebuilt with _mv
+        self._drag_right = np.zeros(3)
+        self._drag_up = np.zeros(3)
+        # Projection matrix, rebuilt on resize
+        self._proj = np.identity(4, dtype=np.float32)
+        self._last_aspect = None
+        # Grid line ranges inside the view, recomputed when the camera changes
+        self._grid_ranges = np.zeros((2, 0), dtype=np.int32)
+        self._grid_cull_dirty = True
+        
     def setup_logging(self):
         """Set up logging configuration"""
+        # The logger is process-wide; only the first viewport adds its handlers
+        self.logger = logging.getLogger('AeroCalculator')
+        if self.logger.handlers:
+            return
+        
         # Create logs directory if it doesn't exist
         log_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'logs')
         os.makedirs(log_dir, exist_ok=True)
@@ -101,7 +715,6 @@ class Viewport(QOpenGLWidget):
         log_file = os.path.join(log_dir, f'aero_calculator_{timestamp}.log')
         
         # Configure logging
-        self.logger = logging.getLogger('AeroCalculator')
         self.logger.setLevel(logging.DEBUG)
         
         # File handler
@@ -120,6 +733,40 @@ class Viewport(QOpenGLWidget):
         
         self.logger.info(f"Logging initialized. Log file: {log_file}")
 
+    def request_update(self):
+        """Mark the scene as changed and schedule a repaint"""
+        self._dirty = True
+        self.update()
+
+    def schedule_update(self):
+        """Mark the scene as changed and repaint on the next frame tick"""
+        self._dirty = True
+        if not self._paint_timer.isActive():
+            self._paint_timer.start()
+
+    @property
+    def grid_size(self):
+        return self._grid_size
+
+    @grid_size.setter
+    def grid_size(self, value):
+        if value != self._grid_size:
+            self._grid_size = value
+            self._overlay_dirty = True
+            self.request_update()
+
+    @property
+    def grid_spacing(self):
+        return self._grid_spacing
+
+    @grid_spacing.setter
+    def grid_spacing(self, value):
+        if value != self._grid_spacing:
+            self._grid_spacing = value
+            # Spacing is a shader uniform; only the visible line ranges change
+            self._grid_cull_dirty = True
+            self.request_update()
+
     def initializeGL(self):
         try:
             print("INFO: Initializing OpenGL")
@@ -146,15 +793,66 @@ class Viewport(QOpenGLWidget):
         glClearColor(0.15, 0.15, 0.15, 1.0)
         glEnable(GL_DEPTH_TEST)
         glEnable(GL_CULL_FACE)
-        glEnable(GL_LIGHTING)
-        glEnable(GL_LIGHT0)
-        glEnable(GL_COLOR_MATERIAL)
+        # Byte normals come back slightly off unit length
+        glEnable(GL_NORMALIZE)
+        # A fresh context needs the projection loaded again
+        self._last_aspect = None
         
-        # Set up lighting
+        # Set up lighting; it stays disabled except around draw_model
         glLightfv(GL_LIGHT0, GL_POSITION, (5.0, 5.0, 5.0, 1.0))
         glLightfv(GL_LIGHT0, GL_AMBIENT, (0.3, 0.3, 0.3, 1.0))
         glLightfv(GL_LIGHT0, GL_DIFFUSE, (0.8, 0.8, 0.8, 1.0))
         
+        # Model material never changes, so set it once
+        glMaterialfv(GL_FRONT_AND_BACK, GL_AMBIENT, [0.2, 0.2, 0.2, 1.0])
+        glMaterialfv(GL_FRONT_AND_BACK, GL_DIFFUSE, [0.8, 0.8, 0.8, 1.0])
+        glMaterialfv(GL_FRONT_AND_BACK, GL_SPECULAR, [0.1, 0.1, 0.1, 1.0])
+        glMaterialf(GL_FRONT_AND_BACK, GL_SHININESS, 50.0)
+        self._gl_state = {'lighting': False, 'line_width': None}
+        
+        # Gizmo arrows never change; keep them in a static buffer
+        if bool(glGenBuffers):
+            self.vbo_gizmo = GLuint(0)
+            glGenBuffers(1, self.vbo_gizmo)
+            glBindBuffer(GL_ARRAY_BUFFER, self.vbo_gizmo.value)
+            glBufferData(GL_ARRAY_BUFFER, _GIZMO_AXES.nbytes, _GIZMO_AXES, GL_STATIC_DRAW)
+            glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+        # Pressure color ramp for the model, sampled through its cp texture coordinate
+        self.tex_pressure = GLuint(0)
+        glGenTextures(1, self.tex_pressure)
+        glBindTexture(GL_TEXTURE_1D, self.tex_pressure.value)
+        glTexParameteri(GL_TEXTURE_1D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
+        glTexParameteri(GL_TEXTURE_1D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
+        glTexParameteri(GL_TEXTURE_1D, GL_TEXTURE_WRAP_S, GL_CLAMP_TO_EDGE)
+        glPixelStorei(GL_UNPACK_ALIGNMENT, 1)
+        glTexImage1D(GL_TEXTURE_1D, 0, GL_RGB, len(_PRESSURE_RAMP), 0, GL_RGB,
+                     GL_UNSIGNED_BYTE, _PRESSURE_RAMP)
+        glBindTexture(GL_TEXTURE_1D, 0)
+
+        # Shader and static buffer for the grid/axes lines, filled on first draw
+        try:
+            self.line_program = shaders.compileProgram(
+                shaders.compileShader(_LINE_VERTEX_SHADER, GL_VERTEX_SHADER),
+                shaders.compileShader(_LINE_FRAGMENT_SHADER, GL_FRAGMENT_SHADER)
+            )
+        except Exception as e:
+            # The message carries the driver's compile/link log
+            self.logger.warning(f"Failed to build line shaders, drawing the grid and axes "
+                                f"with fixed-function arrays instead: {str(e)}")
+            self.line_program = None
+            self._overlay_dirty = True
+            return
+        self.line_attr_pos = glGetAttribLocation(self.line_program, 'aPos')
+        self.line_attr_col = glGetAttribLocation(self.line_program, 'aCol')
+        self.line_uniform_spacing = glGetUniformLocation(self.line_program, 'uSpacing')
+        
+        # VAOs are per-context, the VBO itself comes from the shared cache
+        if bool(glGenVertexArrays):
+            self.vao_overlay = GLuint(0)
+            glGenVertexArrays(1, self.vao_overlay)
+        self._overlay_dirty = True
+
     def create_buffers(self):
         """Create OpenGL buffer objects"""
         self.logger.debug("Creating OpenGL buffers...")
@@ -171,17 +869,20 @@ class Viewport(QOpenGLWidget):
             # Delete existing buffers
             self.cleanup()
             
-            # Generate new buffers
-            self.vbo_vertices = GLuint(0)
-            self.vbo_normals = GLuint(0)
-            glGenBuffers(1, self.vbo_vertices)
-            glGenBuffers(1, self.vbo_normals)
+            # Generate new buffer, plus a VAO to record its array setup when available
+            self.vbo_model = GLuint(0)
+            glGenBuffers(1, self.vbo_model)
+            self.ebo_model = GLuint(0)
+            glGenBuffers(1, self.ebo_model)
+            if bool(glGenVertexArrays):
+                self.vao_model = GLuint(0)
+                glGenVertexArrays(1, self.vao_model)
             
-            if self.vbo_vertices.value == 0 or self.vbo_normals.value == 0:
+            if self.vbo_model.value == 0:
                 self.logger.error("Failed to generate buffer objects")
                 return False
                 
-            self.logger.debug(f"Created buffers - Vertices: {self.vbo_vertices.value}, Normals: {self.vbo_normals.value}")
+            self.logger.debug(f"Created buffer - Model: {self.vbo_model.value}")
             return True
             
         except Exception as e:
@@ -190,86 +891,359 @@ class Viewport(QOpenGLWidget):
             return False
 
     def resizeGL(self, w, h):
+        self._dirty = True
         if h == 0:
-            h = 1
+            # Collapsed by the dock layout; keep the last projection
+            return
         
         glViewport(0, 0, w, h)
+        aspect = w / h
+        if aspect == self._last_aspect:
+            return
+        self._last_aspect = aspect
+        self._proj = self._build_projection(aspect)
+        self._grid_cull_dirty = True
         glMatrixMode(GL_PROJECTION)
-        glLoadIdentity()
-        gluPerspective(45, w/h, 0.1, 1000.0)
+        glLoadMatrixf(self._proj)
         glMatrixMode(GL_MODELVIEW)
+
+    def _build_projection(self, aspect, fovy=45.0, near=0.1, far=1000.0):
+        """Build a perspective projection (same matrix as gluPerspective), column-major"""
+        f = 1.0 / math.tan(math.radians(fovy) / 2)
+        proj = np.array([
+            [f / aspect, 0, 0, 0],
+            [0, f, 0, 0],
+            [0, 0, (far + near) / (near - far), (2 * far * near) / (near - far)],
+            [0, 0, -1, 0]
+        ], dtype=np.float32)
+        return np.ascontiguousarray(proj.T)
+        
+    def _build_grid_array(self):
+        """Build the line endpoints of the grid as an (N, 3) int16 array in grid units"""
+        n = self.grid_size
+        coords = np.arange(-n, n + 1, dtype=np.int16)
+        zeros = np.zeros_like(coords)
+        near = np.full_like(coords, -n)
+        far = np.full_like(coords, n)
+
+        # Lines parallel to Z at each X offset, then lines parallel to X
+        x_lines = np.stack([coords, zeros, near, coords, zeros, far], axis=1).reshape(-1, 3)
+        z_lines = np.stack([near, zeros, coords, far, zeros, coords], axis=1).reshape(-1, 3)
+        return np.vstack([x_lines, z_lines])
+
+    def _build_axes_array(self):
+        """Build the axes as [x, y, z, r, g, b] rows, positions in grid units"""
+        length = 2
+        return np.array([
+            # X axis (red)
+            [0, 0, 0, 1, 0, 0], [length, 0, 0, 1, 0, 0],
+            # Y axis (green)
+            [0, 0, 0, 0, 1, 0], [0, length, 0, 0, 1, 0],
+            # Z axis (blue)
+            [0, 0, 0, 0, 0, 1], [0, 0, length, 0, 0, 1],
+        ], dtype=np.int16)
+
+    def _build_overlay_array(self):
+        """Concatenate grid and axes lines into one packed 12-byte-per-vertex array"""
+        grid = self._build_grid_array()
+        axes = self._build_axes_array()
+        
+        overlay = np.zeros(len(grid) + len(axes), dtype=_OVERLAY_VERTEX)
+        overlay['pos'][:len(grid)] = grid
+        overlay['col'][:len(grid)] = 77  # Slightly brighter gray for grid (0.3)
+        overlay['pos'][len(grid):] = axes[:, :3]
+        overlay['col'][len(grid):, :3] = axes[:, 3:] * 255
+        overlay['col'][:, 3] = 255
+        return overlay
+
+    def _bind_overlay_attributes(self):
+        """Point the line shader attributes at the overlay VBO"""
+        stride = _OVERLAY_VERTEX.itemsize
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo_overlay.value)
+        glEnableVertexAttribArray(self.line_attr_pos)
+        glVertexAttribPointer(self.line_attr_pos, 3, GL_SHORT, GL_FALSE, stride,
+                              ctypes.c_void_p(_OVERLAY_VERTEX.fields['pos'][1]))
+        glEnableVertexAttribArray(self.line_attr_col)
+        glVertexAttribPointer(self.line_attr_col, 3, GL_UNSIGNED_BYTE, GL_TRUE, stride,
+                              ctypes.c_void_p(_OVERLAY_VERTEX.fields['col'][1]))
+
+    def _bind_overlay_client_arrays(self):
+        """Point the fixed-function vertex/color arrays at the overlay VBO, used
+        when the line shader couldn't be built"""
+        stride = _OVERLAY_VERTEX.itemsize
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo_overlay.value)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glVertexPointer(3, GL_SHORT, stride, ctypes.c_void_p(_OVERLAY_VERTEX.fields['pos'][1]))
+        glEnableClientState(GL_COLOR_ARRAY)
+        glColorPointer(4, GL_UNSIGNED_BYTE, stride, ctypes.c_void_p(_OVERLAY_VERTEX.fields['col'][1]))
+
+    def _upload_overlay(self):
+        """Point at the grid/axes VBO for the current grid size"""
+        key = self._grid_size
+        if key != self._overlay_key:
+            self._release_overlay()
+            entry = Viewport._overlay_cache.get(key)
+            if entry is None:
+                overlay = self._build_overlay_array()
+                vbo = GLuint(0)
+                glGenBuffers(1, vbo)
+                glBindBuffer(GL_ARRAY_BUFFER, vbo.value)
+                # Upload the packed records as raw bytes
+                glBufferData(GL_ARRAY_BUFFER, overlay.nbytes, overlay.view(np.uint8), GL_STATIC_DRAW)
+                entry = Viewport._overlay_cache[key] = [vbo, 0]
+            entry[1] += 1
+            self.vbo_overlay = entry[0]
+            self._overlay_key = key
+        
+        if self.vao_overlay is not None:
+            # Capture the attribute layout once
+            glBindVertexArray(self.vao_overlay.value)
+            self._bind_overlay_attributes()
+            glBindVertexArray(0)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        
+        self.axes_vertex_count = 6
+        self.grid_vertex_count = (2 * self._grid_size + 1) * 4
+        self._overlay_dirty = False
+        self._grid_cull_dirty = True
+
+    def _release_overlay(self):
+        """Drop this viewport's use of its cached grid/axes VBO"""
+        entry = Viewport._overlay_cache.get(self._overlay_key)
+        if entry is not None:
+            entry[1] -= 1
+            if entry[1] <= 0:
+                glDeleteBuffers(1, [entry[0]])
+                del Viewport._overlay_cache[self._overlay_key]
+        self.vbo_overlay = None
+        self._overlay_key = None
+
+    def _visible_ground_bounds(self):
+        """Return (xmin, xmax, zmin, zmax) of the y=0 plane inside the view frustum, or None"""
+        # Frustum corners in world space from the inverse view-projection
+        clip = self._proj.T.astype(np.float64) @ self._mv.T.astype(np.float64)
+        ndc = np.array([[x, y, z, 1.0] for z in (-1, 1) for y in (-1, 1) for x in (-1, 1)])
+        corners = ndc @ np.linalg.inv(clip).T
+        corners = corners[:, :3] / corners[:, 3:]
+        
+        # The visible ground is the frustum cut by y=0; its vertices lie on the
+        # frustum edges that cross the plane
+        edges = [(0, 1), (2, 3), (4, 5), (6, 7), (0, 2), (1, 3),
+                 (4, 6), (5, 7), (0, 4), (1, 5), (2, 6), (3, 7)]
+        a = corners[[i for i, _ in edges]]
+        b = corners[[j for _, j in edges]]
+        crosses = (a[:, 1] * b[:, 1] <= 0) & (a[:, 1] != b[:, 1])
+        if not crosses.any():
+            return None
+        a, b = a[crosses], b[crosses]
+        t = a[:, 1] / (a[:, 1] - b[:, 1])
+        points = a + (b - a) * t[:, None]
+        return points[:, 0].min(), points[:, 0].max(), points[:, 2].min(), points[:, 2].max()
+
+    def _cull_grid_ranges(self):
+        """Work out which (first, count) vertex ranges of the grid are in view"""
+        bounds = self._visible_ground_bounds()
+        if bounds is None:
+            return []
+        xmin, xmax, zmin, zmax = bounds
+        n = self._grid_size
+        spacing = self._grid_spacing
+        extent = n * spacing
+        
+        def line_span(lo, hi):
+            # Indices of the grid lines whose offset falls within [lo, hi]
+            first = max(int(np.ceil(lo / spacing)) + n, 0)
+            last = min(int(np.floor(hi / spacing)) + n, 2 * n)
+            return first, last
+        
+        ranges = []
+        # Lines parallel to Z: at offsets along X, spanning the whole Z extent
+        if zmax >= -extent and zmin <= extent:
+            first, last = line_span(xmin, xmax)
+            if first <= last:
+                ranges.append((2 * first, 2 * (last - first + 1)))
+        # Lines parallel to X follow in the buffer
+        if xmax >= -extent and xmin <= extent:
+            first, last = line_span(zmin, zmax)
+            if first <= last:
+                ranges.append((2 * (2 * n + 1) + 2 * first, 2 * (last - first + 1)))
+        return ranges
+
+    def draw_overlay(self):
+        """Draw the grid and axes from the shared line VBO"""
+        if self._overlay_dirty:
+            self._upload_overlay()
+        
+        # Visibility only selects which ranges of the buffer are drawn; ranges
+        # sharing a line width go out in one glMultiDrawArrays call
+        batches = []
+        if self.show_grid:
+            if self._grid_cull_dirty:
+                # Stored as [firsts, counts] rows ready for glMultiDrawArrays
+                ranges = np.array(self._cull_grid_ranges(), dtype=np.int32).reshape(-1, 2)
+                self._grid_ranges = np.ascontiguousarray(ranges.T)
+                self._grid_cull_dirty = False
+            if self._grid_ranges.shape[1]:
+                batches.append((1.0, self._grid_ranges))
+        if self.show_axes:
+            batches.append((2.0, np.array([[self.grid_vertex_count], [self.axes_vertex_count]],
+                                          dtype=np.int32)))
+        if not batches:
+            return
         
-    def draw_grid(self):
-        glDisable(GL_LIGHTING)  # Disable lighting for grid
-        glLineWidth(1.0)
-        glBegin(GL_LINES)
-        glColor3f(0.3, 0.3, 0.3)  # Slightly brighter gray for grid
-        
-        for i in range(-self.grid_size, self.grid_size + 1):
-            glVertex3f(i * self.grid_spacing, 0, -self.grid_size * self.grid_spacing)
-            glVertex3f(i * self.grid_spacing, 0, self.grid_size * self.grid_spacing)
-            glVertex3f(-self.grid_size * self.grid_spacing, 0, i * self.grid_spacing)
-            glVertex3f(self.grid_size * self.grid_spacing, 0, i * self.grid_spacing)
-        glEnd()
-        glEnable(GL_LIGHTING)  # Re-enable lighting
-        
-    def draw_axes(self):
-        glDisable(GL_LIGHTING)  # Disable lighting for axes
-        glLineWidth(2.0)
-        glBegin(GL_LINES)
-        # X axis (red)
-        glColor3f(1, 0, 0)
-        glVertex3f(0, 0, 0)
-        glVertex3f(self.grid_spacing * 2, 0, 0)
-        # Y axis (green)
-        glColor3f(0, 1, 0)
-        glVertex3f(0, 0, 0)
-        glVertex3f(0, self.grid_spacing * 2, 0)
-        # Z axis (blue)
-        glColor3f(0, 0, 1)
-        glVertex3f(0, 0, 0)
-        glVertex3f(0, 0, self.grid_spacing * 2)
-        glEnd()
-        glEnable(GL_LIGHTING)  # Re-enable lighting
+        if self.line_program is None:
+            # Fixed-function fallback: the spacing scale goes on the matrix stack
+            glPushMatrix()
+            glScalef(self._grid_spacing, self._grid_spacing, self._grid_spacing)
+            self._bind_overlay_client_arrays()
+        else:
+            glUseProgram(self.line_program)
+            glUniform1f(self.line_uniform_spacing, self._grid_spacing)
+            if self.vao_overlay is not None:
+                glBindVertexArray(self.vao_overlay.value)
+            else:
+                self._bind_overlay_attributes()
+        
+        for width, (firsts, counts) in batches:
+            self._set_line_width(width)
+            glMultiDrawArrays(GL_LINES, firsts, counts, len(firsts))
+        
+        if self.line_program is None:
+            glDisableClientState(GL_VERTEX_ARRAY)
+            glDisableClientState(GL_COLOR_ARRAY)
+            glBindBuffer(GL_ARRAY_BUFFER, 0)
+            glPopMatrix()
+            return
+        if self.vao_overlay is not None:
+            glBindVertexArray(0)
+        else:
+            glDisableVertexAttribArray(self.line_attr_pos)
+            glDisableVertexAttribArray(self.line_attr_col)
+            glBindBuffer(GL_ARRAY_BUFFER, 0)
+        glUseProgram(0)
+
+    def _map_vbo(self, nbytes):
+        """Persistently map the bound model VBO for writing"""
+        self._model_map = glMapBufferRange(GL_ARRAY_BUFFER, 0, nbytes, _PERSISTENT_MAP_FLAGS)
+        self.vbo_is_persistent = bool(self._model_map)
+        if not self.vbo_is_persistent:
+            # GL errors aren't checked, so this is the only sign the map failed
+            self.logger.warning("Persistent mapping of the model buffer failed; "
+                                "vertex edits will be copied with per-write maps")
+
+    def write_model_vertices(self):
+        """Push model_interleaved to the GPU after the vertices were edited"""
+        data = self.model_interleaved
+        if self.vbo_is_persistent:
+            # Coherent mapping: a plain memory copy, no GL call or context needed
+            ctypes.memmove(self._model_map, data.ctypes.data, data.nbytes)
+            return
+        self.makeCurrent()
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo_model.value)
+        ptr = None
+        if self.vbo_is_immutable:
+            # glBufferStorage storage can't be orphaned; a plain write mapping
+            # waits for queued draws instead
+            ptr = glMapBufferRange(GL_ARRAY_BUFFER, 0, data.nbytes, GL_MAP_WRITE_BIT)
+        elif bool(glMapBufferRange):
+            # Orphan the old storage so the copy doesn't stall behind queued draws
+            glBufferData(GL_ARRAY_BUFFER, data.nbytes, None, GL_DYNAMIC_DRAW)
+            ptr = glMapBufferRange(GL_ARRAY_BUFFER, 0, data.nbytes, _STREAM_MAP_FLAGS)
+        if ptr:
+            ctypes.memmove(ptr, data.ctypes.data, data.nbytes)
+            glUnmapBuffer(GL_ARRAY_BUFFER)
+        else:
+            glBufferSubData(GL_ARRAY_BUFFER, 0, data.nbytes, data.view(np.uint8))
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        self.doneCurrent()
+
+    def _bind_model_arrays(self):
+        """Enable the client arrays and point them at the interleaved model VBO
+        and its index buffer"""
+        stride = _MODEL_VERTEX.itemsize
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_NORMAL_ARRAY)
+        glEnableClientState(GL_TEXTURE_COORD_ARRAY)
+        glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self.ebo_model.value)
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo_model.value)
+        glVertexPointer(3, GL_FLOAT, stride, ctypes.c_void_p(_MODEL_VERTEX.fields['pos'][1]))
+        glNormalPointer(GL_BYTE, stride, ctypes.c_void_p(_MODEL_VERTEX.fields['nrm'][1]))
+        glTexCoordPointer(1, GL_FLOAT, stride, ctypes.c_void_p(_MODEL_VERTEX.fields['cp'][1]))
+
+    def _stream_to_buffer(self, vbo, data, capacity):
+        """Write data into a dynamic VBO through a write-only mapping, growing its
+        storage only when data doesn't fit; returns the new capacity in bytes"""
+        # The raw memory copy below needs one packed block
+        data = np.ascontiguousarray(data)
+        glBindBuffer(GL_ARRAY_BUFFER, vbo.value)
+        if data.nbytes > capacity:
+            capacity = data.nbytes
+            glBufferData(GL_ARRAY_BUFFER, capacity, None, GL_DYNAMIC_DRAW)
+        ptr = None
+        if data.nbytes and bool(glMapBufferRange):
+            ptr = glMapBufferRange(GL_ARRAY_BUFFER, 0, data.nbytes, _STREAM_MAP_FLAGS)
+        if ptr:
+            ctypes.memmove(ptr, data.ctypes.data, data.nbytes)
+            glUnmapBuffer(GL_ARRAY_BUFFER)
+        elif data.nbytes:
+            glBufferSubData(GL_ARRAY_BUFFER, 0, data.nbytes, data.view(np.uint8))
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+        return capacity
+
+    def _set_lighting(self, enabled):
+        """Switch model lighting on or off, skipping the GL calls if already set"""
+        if self._gl_state['lighting'] == enabled:
+            return
+        for cap in (GL_LIGHTING, GL_LIGHT0, GL_COLOR_MATERIAL):
+            if enabled:
+                glEnable(cap)
+            else:
+                glDisable(cap)
+        self._gl_state['lighting'] = enabled
+
+    def _set_line_width(self, width):
+        """Set the line width, skipping the GL call if it is unchanged"""
+        if self._gl_state['line_width'] != width:
+            glLineWidth(width)
+            self._gl_state['line_width'] = width
 
     def draw_model(self):
-        if not self.model_loaded or self.vertex_count == 0:
+        if not self.model_loaded or self.index_count == 0:
             return
 
         try:
             glPushMatrix()
-            
-            # Enable states
-            glEnable(GL_LIGHTING)
-            glEnable(GL_LIGHT0)
-            glEnable(GL_COLOR_MATERIAL)
-            
-            # Set material properties
-            glColor4f(0.8, 0.8, 0.8, 1.0)
-            glMaterialfv(GL_FRONT_AND_BACK, GL_AMBIENT, [0.2, 0.2, 0.2, 1.0])
-            glMaterialfv(GL_FRONT_AND_BACK, GL_DIFFUSE, [0.8, 0.8, 0.8, 1.0])
-            glMaterialfv(GL_FRONT_AND_BACK, GL_SPECULAR, [0.1, 0.1, 0.1, 1.0])
-            glMaterialf(GL_FRONT_AND_BACK, GL_SHININESS, 50.0)
-            
-            # Enable vertex arrays
-            glEnableClientState(GL_VERTEX_ARRAY)
-            glEnableClientState(GL_NORMAL_ARRAY)
-            
-            # Bind vertex buffer
-            glBindBuffer(GL_ARRAY_BUFFER, self.vbo_vertices.value)
-            glVertexPointer(3, GL_FLOAT, 0, None)
-            
-            # Bind normal buffer
-            glBindBuffer(GL_ARRAY_BUFFER, self.vbo_normals.value)
-            glNormalPointer(GL_FLOAT, 0, None)
+            glTranslatef(*self.model_position)
+            
+            # Lighting only applies to the shaded mesh
+            self._set_lighting(True)
+            if self._cp_matrix is not None:
+                # The texture matrix maps each vertex's cp onto the pressure ramp,
+                # which then tints the lit white surface
+                glColor4f(1.0, 1.0, 1.0, 1.0)
+                glMatrixMode(GL_TEXTURE)
+                glLoadMatrixf(self._cp_matrix)
+                glMatrixMode(GL_MODELVIEW)
+                glBindTexture(GL_TEXTURE_1D, self.tex_pressure.value)
+                glEnable(GL_TEXTURE_1D)
+            else:
+                glColor4f(0.8, 0.8, 0.8, 1.0)
             
             # Draw the model
-            glDrawArrays(GL_TRIANGLES, 0, self.vertex_count)
-            
-            # Cleanup states
-            glDisableClientState(GL_VERTEX_ARRAY)
-            glDisableClientState(GL_NORMAL_ARRAY)
-            glBindBuffer(GL_ARRAY_BUFFER, 0)
+            if self.vao_model is not None:
+                glBindVertexArray(self.vao_model.value)
+                glDrawElements(GL_TRIANGLES, self.index_count, GL_UNSIGNED_INT, ctypes.c_void_p(0))
+                glBindVertexArray(0)
+            else:
+                self._bind_model_arrays()
+                glDrawElements(GL_TRIANGLES, self.index_count, GL_UNSIGNED_INT, ctypes.c_void_p(0))
+                glDisableClientState(GL_VERTEX_ARRAY)
+                glDisableClientState(GL_NORMAL_ARRAY)
+                glDisableClientState(GL_TEXTURE_COORD_ARRAY)
+                glBindBuffer(GL_ARRAY_BUFFER, 0)
+                glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+            if self._cp_matrix is not None:
+                glDisable(GL_TEXTURE_1D)
             
             glPopMatrix()
             
@@ -277,34 +1251,79 @@ class Viewport(QOpenGLWidget):
             self.logger.error(f"Error drawing model: {str(e)}")
 
     def paintGL(self):
-        glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
-        glLoadIdentity()
+        if not self._dirty:
+            # Nothing changed since the last frame, which is still in the framebuffer
+            return
         
-        # Apply camera transformations
-        gluLookAt(
-            self.zoom * np.sin(np.radians(self.rotation[1])), 
-            self.zoom * np.sin(np.radians(self.rotation[0])), 
-            self.zoom * np.cos(np.radians(self.rotation[1])),
-            0, 0, 0,
-            0, 1, 0
-        )
+        glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
         
-        # Apply panning transformation
-        glTranslatef(self.pan_offset[0], self.pan_offset[1], 0)
+        # Apply camera and panning transformations
+        if self._mv_dirty:
+            self._rebuild_mv()
+        glMatrixMode(GL_MODELVIEW)
+        glLoadMatrixf(self._mv)
         
-        if self.show_grid:
-            self.draw_grid()
-        if self.show_axes:
-            self.draw_axes()
+        # Lit geometry first, then everything unlit, so lighting flips at most twice a frame
         if self.model_loaded:
             self.draw_model()
-            if hasattr(self, 'pressure_data'):
-                self.draw_streamlines()
-        if hasattr(self, 'wind_plate'):
+        self._set_lighting(False)
+        
+        self.draw_overlay()
+        if self.model_loaded and self.pressure_data is not None:
+            self.draw_streamlines()
+        if self.wind_plate is not None:
             self.draw_wind_plate()
             
         # Draw transform gizmos if an object is selected
         self.draw_transform_gizmos()
+        
+        self._dirty = False
+
+    def _rebuild_mv(self):
+        """Rebuild the cached camera modelview matrix (look-at followed by pan)"""
+        # Plain float trig; numpy ufuncs on scalars allocate 0-d arrays
+        rx = math.radians(self.rotation[0])
+        ry = math.radians(self.rotation[1])
+        eye = np.array([
+            self.zoom * math.sin(ry),
+            self.zoom * math.sin(rx),
+            self.zoom * math.cos(ry)
+        ])
+        
+        # Camera basis looking at the origin with +Y up
+        forward = -eye / np.linalg.norm(eye)
+        side = np.cross(forward, np.array([0.0, 1.0, 0.0]))
+        side = side / np.linalg.norm(side)
+        up = np.cross(side, forward)
+        
+        view = np.identity(4)
+        view[0, :3] = side
+        view[1, :3] = up
+        view[2, :3] = -forward
+        view[:3, 3] = -view[:3, :3] @ eye
+        
+        pan = np.identity(4)
+        pan[0, 3] = self.pan_offset[0]
+        pan[1, 3] = self.pan_offset[1]
+        
+        # OpenGL expects column-major storage
+        self._mv = np.ascontiguousarray((view @ pan).T, dtype=np.float32)
+        
+        # Drag basis: right/up of the rotation direction, ignoring zoom and pan
+        cos_x = math.cos(rx)
+        direction = np.array([math.sin(ry) * cos_x, math.sin(rx), math.cos(ry) * cos_x])
+        right = np.cross(direction, np.array([0.0, 1.0, 0.0]))
+        self._drag_right = right / np.linalg.norm(right)
+        up = np.cross(self._drag_right, direction)
+        self._drag_up = up / np.linalg.norm(up)
+        self._mv_dirty = False
+        self._grid_cull_dirty = True
+
+    def _camera_basis(self):
+        """World-space (right, up) vectors for mapping mouse motion, cached until the camera changes"""
+        if self._mv_dirty:
+            self._rebuild_mv()
+        return self._drag_right, self._drag_up
 
     def mousePressEvent(self, event):
         self.last_pos = event.pos()
@@ -336,28 +1355,45 @@ class Viewport(QOpenGLWidget):
         ray_start, ray_dir = self.get_ray_from_mouse(mouse_pos)
         
         # Check wind plate if it exists
-        if hasattr(self, 'wind_plate'):
+        if self.wind_plate is not None:
             pos = self.wind_plate['position']
             # Simple distance check to wind plate center
             distance = np.linalg.norm(ray_start - pos)
             if distance < 2.0:  # Selection threshold
                 self.selected_object = 'wind_plate'
-                self.update()
+                self.request_update()
                 return
         
         # Check model if loaded
-        if self.model_loaded:
-            # Simple distance check to model center
-            distance = np.linalg.norm(ray_start)
-            if distance < 2.0:  # Selection threshold
-                self.selected_object = 'model'
-                self.update()
-                return
+        if self.model_loaded and self.pick_model(ray_start, ray_dir) is not None:
+            self.selected_object = 'model'
+            self.request_update()
+            return
         
         # If nothing was selected, clear selection
         self.selected_object = None
         self.selected_axis = None
-        self.update()
+        self.request_update()
+
+    def model_triangles(self):
+        """(T, 3, 3) corner positions of the model triangles"""
+        return self.model_vertices[self.model_indices].reshape(-1, 3, 3)
+
+    def pick_model(self, ray_start, ray_dir):
+        """Distance along the ray to the nearest model triangle, or None"""
+        if self._tri_lo is None:
+            return None
+        # Bounds are in model space; move the ray there instead
+        ray_start = ray_start - self.model_position
+        # Whole-model box first, then only the triangles whose boxes the ray enters
+        if not np.isfinite(_ray_aabb(ray_start, ray_dir, self.bbox_min, self.bbox_max)):
+            return None
+        candidates = np.flatnonzero(np.isfinite(
+            _ray_aabb(ray_start, ray_dir, self._tri_lo, self._tri_hi)))
+        if len(candidates) == 0:
+            return None
+        tris = self.model_vertices[self.model_indices.reshape(-1, 3)[candidates]]
+        return _ray_triangles(ray_start, ray_dir, tris.astype(np.float64))
 
     def mouseReleaseEvent(self, event):
         if event.button() == Qt.MouseButton.RightButton:
@@ -371,7 +1407,7 @@ class Viewport(QOpenGLWidget):
                 self.dragging = False
                 self.selected_axis = None
                 self.setCursor(Qt.CursorShape.ArrowCursor)
-            self.update()
+            self.request_update()
 
     def mouseMoveEvent(self, event):
         if self.last_pos is None:
@@ -380,43 +1416,34 @@ class Viewport(QOpenGLWidget):
         
         dx = event.pos().x() - self.last_pos.x()
         dy = event.pos().y() - self.last_pos.y()
+        if dx == 0 and dy == 0:
+            return
         
+        changed = False
         if self.orbiting and event.buttons() & Qt.MouseButton.RightButton:
             # Orbit camera around target
             self.rotation[1] -= dx * 0.5
             self.rotation[0] += dy * 0.5
+            self._mv_dirty = True
+            changed = True
         
         elif self.panning and event.buttons() & Qt.MouseButton.MiddleButton:
             pan_speed = 0.01 * self.zoom
-            
-            # Get camera's view direction
-            rot_y = np.radians(self.rotation[1])
-            rot_x = np.radians(self.rotation[0])
-            
-            # Calculate camera's forward vector
-            forward = np.array([
-                np.sin(rot_y) * np.cos(rot_x),
-                np.sin(rot_x),
-                np.cos(rot_y) * np.cos(rot_x)
-            ])
-            
-            # Calculate camera's right vector
-            right = np.cross(forward, np.array([0, 1, 0]))
-            right = right / np.linalg.norm(right)
-            
-            # Calculate camera's up vector
-            up = np.cross(right, forward)
-            up = up / np.linalg.norm(up)
+            right, up = self._camera_basis()
             
             # Apply movement in camera space
             self.pan_offset[0] += (right[0] * dx + up[0] * -dy) * pan_speed
             self.pan_offset[1] += (right[1] * dx + up[1] * -dy) * pan_speed
+            self._mv_dirty = True
+            changed = True
         
         elif self.dragging and self.selected_axis and self.selected_object:
             # Handle transform dragging
             self.handle_transform_drag(dx, dy)
+            changed = True
         
-        self.update()
+        if changed:
+            self.schedule_update()
         self.last_pos = event.pos()
 
     def handle_transform_drag(self, dx, dy):
@@ -427,24 +1454,8 @@ class Viewport(QOpenGLWidget):
         # Calculate movement speed based on zoom level
         move_speed = 0.01 * self.zoom
         
-        # Get camera's view direction
-        rot_y = np.radians(self.rotation[1])
-        rot_x = np.radians(self.rotation[0])
-        
-        # Calculate camera's view vectors
-        forward = np.array([
-            np.sin(rot_y) * np.cos(rot_x),
-            np.sin(rot_x),
-            np.cos(rot_y) * np.cos(rot_x)
-        ])
-        
-        # Calculate camera's right vector
-        right = np.cross(forward, np.array([0, 1, 0]))
-        right = right / np.linalg.norm(right)
-        
-        # Calculate camera's up vector
-        up = np.cross(right, forward)
-        up = up / np.linalg.norm(up)
+        # Camera's right and up vectors
+        right, up = self._camera_basis()
         
         # Calculate movement based on selected axis and screen movement
         if self.selected_axis == 'x':
@@ -469,15 +1480,8 @@ class Viewport(QOpenGLWidget):
             if isinstance(self.parent(), EditorWindow):
                 self.parent().update_transform_ui()
         elif self.selected_object == 'model':
-            # For model, we'll need to update all vertices
-            if hasattr(self, 'model_vertices'):
-                vertices = np.array(self.model_vertices).reshape(-1, 3)
-                vertices += movement
-                self.model_vertices = vertices.flatten()
-                # Update vertex buffer
-                glBindBuffer(GL_ARRAY_BUFFER, self.vbo_vertices.value)
-                glBufferData(GL_ARRAY_BUFFER, self.model_vertices.nbytes, self.model_vertices, GL_STATIC_DRAW)
-                glBindBuffer(GL_ARRAY_BUFFER, 0)
+            # draw_model applies the translation; the vertices never change
+            self.model_position += movement
 
     def check_gizmo_pick(self, mouse_pos):
         """Check if a transform gizmo was clicked"""
@@ -490,32 +1494,28 @@ class Viewport(QOpenGLWidget):
         # Get object position
         obj_pos = self.get_object_position()
         
-        # Check distance to each axis
-        axes = {
-            'x': (np.array([1, 0, 0]), (1, 0, 0)),
-            'y': (np.array([0, 1, 0]), (0, 1, 0)),
-            'z': (np.array([0, 0, 1]), (0, 0, 1))
-        }
-        
-        closest_axis = None
-        min_distance = 0.1  # Threshold for selection
-        
-        for axis_name, (axis_dir, color) in axes.items():
-            distance = self.point_line_distance(
-                ray_start, ray_dir,
-                obj_pos,
-                obj_pos + axis_dir * 2.0
-            )
-            if distance < min_distance:
-                min_distance = distance
-                closest_axis = axis_name
+        # Rays that miss the box around the gizmo can't be near any axis
+        if not np.isfinite(_ray_aabb(ray_start, ray_dir, obj_pos - 0.1, obj_pos + 2.1)):
+            self.selected_axis = None
+            return
         
-        self.selected_axis = closest_axis
+        self.selected_axis = self._pick_gizmo_axis(ray_start, ray_dir, obj_pos)
+
+    def _pick_gizmo_axis(self, ray_start, ray_dir, origin, threshold=0.1):
+        """Name of the gizmo axis at origin closest to the ray, or None if none is within threshold"""
+        # Same measure as point_line_distance, for all three axes at once
+        crosses = np.cross(ray_dir, _GIZMO_AXIS_DIRS)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            distances = np.abs(crosses @ (origin - ray_start)) / np.linalg.norm(crosses, axis=1)
+        # An axis parallel to the ray can't be picked
+        distances = np.nan_to_num(distances, nan=np.inf)
+        closest = int(np.argmin(distances))
+        return 'xyz'[closest] if distances[closest] < threshold else None
 
     def get_object_position(self):
         """Get the current position of the selected object"""
         if self.selected_object == 'model':
-            return np.array([0, 0, 0])  # Model is centered at origin
+            return self.model_position.copy()
         elif self.selected_object == 'wind_plate':
             return self.wind_plate['position']
         return np.array([0, 0, 0])
@@ -523,14 +1523,11 @@ class Viewport(QOpenGLWidget):
     def get_object_transform(self):
         """Get the current transform of the selected object"""
         if self.selected_object == 'model':
-            # For model, return center position and zero rotation
-            if hasattr(self, 'model_vertices'):
-                vertices = np.array(self.model_vertices).reshape(-1, 3)
-                center = np.mean(vertices, axis=0)
-                return {
-                    'position': center,
-                    'rotation': np.array([0.0, 0.0, 0.0])
-                }
+            # For model, return its translation and zero rotation
+            return {
+                'position': self.model_position.copy(),
+                'rotation': np.array([0.0, 0.0, 0.0])
+            }
         elif self.selected_object == 'wind_plate':
             return {
                 'position': self.wind_plate['position'].copy(),
@@ -547,6 +1544,24 @@ class Viewport(QOpenGLWidget):
                 self.parent().wind_pos_x.setValue(self.wind_plate['position'][0])
                 self.parent().wind_pos_y.setValue(self.wind_plate['position'][1])
                 self.parent().wind_pos_z.setValue(self.wind_plate['position'][2])
+        elif self.selected_object == 'model':
+            self.model_position += movement
+
+    def draw_gizmo_axes(self, highlight=None):
+        """Draw the X/Y/Z gizmo arrows from one interleaved color/vertex array,
+        with a thicker segment over the highlighted axis"""
+        if self.vbo_gizmo is not None:
+            glBindBuffer(GL_ARRAY_BUFFER, self.vbo_gizmo.value)
+            glInterleavedArrays(GL_C3F_V3F, 0, ctypes.c_void_p(0))
+        else:
+            glInterleavedArrays(GL_C3F_V3F, 0, _GIZMO_AXES)
+        glDrawArrays(GL_LINES, 0, _GIZMO_ARROW_COUNT)
+        if highlight:
+            self._set_line_width(3.0)
+            glDrawArrays(GL_LINES, _GIZMO_ARROW_COUNT + 2 * 'xyz'.index(highlight), 2)
+        glDisableClientState(GL_COLOR_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
 
     def draw_transform_gizmos(self):
         """Draw transform gizmos for the selected object"""
@@ -563,71 +1578,10 @@ class Viewport(QOpenGLWidget):
                 
             glTranslatef(pos[0], pos[1], pos[2])
             
-            # Draw transform axes
-            glDisable(GL_LIGHTING)
-            glLineWidth(2.0)
-            
-            axis_length = 2.0
-            
-            # X axis (red)
-            glBegin(GL_LINES)
-            glColor3f(1, 0, 0)
-            glVertex3f(0, 0, 0)
-            glVertex3f(axis_length, 0, 0)
-            # Arrow head
-            glVertex3f(axis_length, 0, 0)
-            glVertex3f(axis_length - 0.2, 0.1, 0)
-            glVertex3f(axis_length, 0, 0)
-            glVertex3f(axis_length - 0.2, -0.1, 0)
-            glEnd()
-            
-            # Y axis (green)
-            glBegin(GL_LINES)
-            glColor3f(0, 1, 0)
-            glVertex3f(0, 0, 0)
-            glVertex3f(0, axis_length, 0)
-            # Arrow head
-            glVertex3f(0, axis_length, 0)
-            glVertex3f(0.1, axis_length - 0.2, 0)
-            glVertex3f(0, axis_length, 0)
-            glVertex3f(-0.1, axis_length - 0.2, 0)
-            glEnd()
-            
-            # Z axis (blue)
-            glBegin(GL_LINES)
-            glColor3f(0, 0, 1)
-            glVertex3f(0, 0, 0)
-            glVertex3f(0, 0, axis_length)
-            # Arrow head
-            glVertex3f(0, 0, axis_length)
-            glVertex3f(0.1, 0, axis_length - 0.2)
-            glVertex3f(0, 0, axis_length)
-            glVertex3f(-0.1, 0, axis_length - 0.2)
-            glEnd()
+            # Draw transform axes, highlighting the selected one
+            self._set_line_width(2.0)
+            self.draw_gizmo_axes(self.selected_axis)
             
-            # Highlight selected axis
-            if self.selected_axis:
-                glLineWidth(3.0)
-                if self.selected_axis == 'x':
-                    glColor3f(1, 0.5, 0.5)
-                    glBegin(GL_LINES)
-                    glVertex3f(0, 0, 0)
-                    glVertex3f(axis_length, 0, 0)
-                    glEnd()
-                elif self.selected_axis == 'y':
-                    glColor3f(0.5, 1, 0.5)
-                    glBegin(GL_LINES)
-                    glVertex3f(0, 0, 0)
-                    glVertex3f(0, axis_length, 0)
-                    glEnd()
-                else:  # z
-                    glColor3f(0.5, 0.5, 1)
-                    glBegin(GL_LINES)
-                    glVertex3f(0, 0, 0)
-                    glVertex3f(0, 0, axis_length)
-                    glEnd()
-            
-            glEnable(GL_LIGHTING)
             glPopMatrix()
             
         except Exception as e:
@@ -640,12 +1594,14 @@ class Viewport(QOpenGLWidget):
         
         # Add minimum and maximum zoom constraints
         self.zoom = max(self.min_zoom, min(self.max_zoom, new_zoom))
-        self.update()
+        self._mv_dirty = True
+        # Touchpads send wheel events at a high rate; coalesce like mouse motion
+        self.schedule_update()
         
     def dragEnterEvent(self, event):
         if event.mimeData().hasUrls():
             for url in event.mimeData().urls():
-                if url.toLocalFile().lower().endswith(('.obj', '.fbx')):
+                if os.path.splitext(url.toLocalFile())[1].lower() in _MODEL_EXTENSIONS:
                     event.accept()
                     return
         elif event.mimeData().hasText() and event.mimeData().text() == "wind_source":
@@ -657,7 +1613,7 @@ class Viewport(QOpenGLWidget):
         if event.mimeData().hasUrls():
             for url in event.mimeData().urls():
                 file_path = url.toLocalFile()
-                if file_path.lower().endswith(('.obj', '.fbx')):
+                if os.path.splitext(file_path)[1].lower() in _MODEL_EXTENSIONS:
                     self.load_model(file_path)
                     break
         elif event.mimeData().hasText() and event.mimeData().text() == "wind_source":
@@ -669,18 +1625,30 @@ class Viewport(QOpenGLWidget):
         """Clean up OpenGL resources"""
         self.logger.debug("Cleaning up OpenGL resources...")
         try:
-            if self.vbo_vertices is not None:
-                self.logger.debug(f"Deleting vertex buffer: {self.vbo_vertices}")
-                glDeleteBuffers(1, [self.vbo_vertices])
-                self.vbo_vertices = None
-                
-            if self.vbo_normals is not None:
-                self.logger.debug(f"Deleting normal buffer: {self.vbo_normals}")
-                glDeleteBuffers(1, [self.vbo_normals])
-                self.vbo_normals = None
+            if self.vbo_model is not None:
+                if self.vbo_is_persistent:
+                    glBindBuffer(GL_ARRAY_BUFFER, self.vbo_model.value)
+                    glUnmapBuffer(GL_ARRAY_BUFFER)
+                    glBindBuffer(GL_ARRAY_BUFFER, 0)
+                    self.vbo_is_persistent = False
+                    self._model_map = None
+                self.vbo_is_immutable = False
+                self.logger.debug(f"Deleting model buffer: {self.vbo_model}")
+                glDeleteBuffers(1, [self.vbo_model])
+                self.vbo_model = None
+            
+            if self.ebo_model is not None:
+                glDeleteBuffers(1, [self.ebo_model])
+                self.ebo_model = None
+            
+            if self.vao_model is not None:
+                glDeleteVertexArrays(1, [self.vao_model])
+                self.vao_model = None
                 
             self.vertex_count = 0
+            self.index_count = 0
             self.model_loaded = False
+            self._model_hash = None
             self.logger.debug("Cleanup complete")
             
         except Exception as e:
@@ -717,131 +1685,138 @@ class Viewport(QOpenGLWidget):
     def load_model(self, file_path):
         """Load a 3D model file."""
         try:
-            # Clean up existing resources
-            self.cleanup()
-            
             if file_path.lower().endswith('.obj'):
-                self.load_obj(file_path)
-                self.current_model_path = file_path
+                loaded_hash = self._model_hash if self.model_loaded else None
+                self._start_obj_load(file_path, loaded_hash)
             elif file_path.lower().endswith('.fbx'):
                 QMessageBox.warning(self, "Warning", "FBX support coming soon!")
-                return
                 
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to load model: {str(e)}")
+            print(f"Error loading model: {str(e)}")
+            self.current_model_path = None
+
+    def _start_obj_load(self, file_path, loaded_hash):
+        """Parse an OBJ file in the background; the upload happens in _on_obj_loaded"""
+        self.logger.info(f"Loading OBJ file: {file_path}")
+        self._load_token += 1
+        worker = ObjLoadWorker(self._load_token, file_path, loaded_hash)
+        worker.signals.finished.connect(self._on_obj_loaded)
+        worker.signals.failed.connect(self._on_obj_failed)
+        if isinstance(self.parent(), EditorWindow):
+            self.parent().statusBar().showMessage(f"Loading {os.path.basename(file_path)}...")
+        QThreadPool.globalInstance().start(worker)
+
+    def _on_obj_loaded(self, token, file_path, model_hash, model):
+        """Upload a parsed OBJ on the GUI thread and finish loading it"""
+        if token != self._load_token:
+            return  # A newer load has been requested since
+        
+        try:
+            if model is None:
+                if not (self.model_loaded and model_hash == self._model_hash):
+                    # The matching mesh was released while parsing; parse it after all
+                    self._start_obj_load(file_path, None)
+                    return
+                # Identical mesh is already uploaded; reuse its buffers
+                self.logger.info(f"Reusing loaded buffers for {file_path}")
+            else:
+                self.upload_model(*model)
+                self._model_hash = model_hash
+            self.current_model_path = file_path
+            # A freshly loaded model starts back at the origin
+            self.model_position[:] = 0
+            
             self.model_loaded = True
             if isinstance(self.parent(), EditorWindow):
                 self.parent().update_scene_hierarchy(os.path.basename(file_path))
                 self.parent().update_properties_panel(os.path.basename(file_path))
                 self.parent().calculate_model_properties()
+                # Non-modal, so the new mesh is drawn right away
+                self.parent().statusBar().showMessage(
+                    f"Model loaded: {os.path.basename(file_path)}", 3000)
             
-            self.update()
-            QMessageBox.information(self, "Success", f"Model loaded: {os.path.basename(file_path)}")
+            self.request_update()
             
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to load model: {str(e)}")
             print(f"Error loading model: {str(e)}")
             self.current_model_path = None
 
-    def load_obj(self, file_path):
-        """Load an OBJ file."""
-        self.logger.info(f"Loading OBJ file: {file_path}")
-        
-        try:
-            vertices = []
-            normals = []
-            faces = []
-            temp_vertices = []
-            temp_normals = []
-            
-            # Read file
-            self.logger.debug("Reading OBJ file...")
-            with open(file_path, 'r') as f:
-                for line in f:
-                    if line.startswith('#'): continue
-                    values = line.split()
-                    if not values: continue
-                    
-                    if values[0] == 'v':
-                        temp_vertices.append([float(x) for x in values[1:4]])
-                    elif values[0] == 'vn':
-                        temp_normals.append([float(x) for x in values[1:4]])
-                    elif values[0] == 'f':
-                        # Handle different face formats
-                        verts = []
-                        norms = []
-                        for v in values[1:]:
-                            w = v.split('/')
-                            # OBJ indices start at 1
-                            verts.append(int(w[0]) - 1)
-                            # Check if normal index exists
-                            if len(w) > 2 and w[2]:
-                                norms.append(int(w[2]) - 1)
-                        faces.append((verts, norms))
-
-            # Process faces into triangles
-            vertices_list = []
-            normals_list = []
-            
-            for face_verts, face_norms in faces:
-                # Triangulate face
-                for i in range(1, len(face_verts) - 1):
-                    # Add vertices for triangle
-                    for idx in [0, i, i + 1]:
-                        vertices_list.append(temp_vertices[face_verts[idx]])
-                        if face_norms and len(face_norms) > idx:
-                            normals_list.append(temp_normals[face_norms[idx]])
-                        else:
-                            # Calculate face normal if not provided
-                            v1 = np.array(temp_vertices[face_verts[0]])
-                            v2 = np.array(temp_vertices[face_verts[i]])
-                            v3 = np.array(temp_vertices[face_verts[i + 1]])
-                            normal = np.cross(v2 - v1, v3 - v1)
-                            normal = normal / np.linalg.norm(normal) if np.linalg.norm(normal) > 0 else np.array([0.0, 1.0, 0.0])
-                            normals_list.append(normal)
+    def _on_obj_failed(self, token, file_path, message):
+        """Report an OBJ file that could not be read or parsed"""
+        if token != self._load_token:
+            return
+        self.logger.error(f"Error loading OBJ file: {message}")
+        QMessageBox.critical(self, "Error", f"Failed to load model: {message}")
+        self.current_model_path = None
 
+    def upload_model(self, interleaved, indices):
+        """Upload an interleaved _MODEL_VERTEX array and its uint32 triangle
+        indices to fresh buffers"""
+        try:
             # Create buffers
             if not self.create_buffers():
                 raise RuntimeError("Failed to create OpenGL buffers")
 
-            # Convert to numpy arrays
-            vertices_array = np.array(vertices_list, dtype=np.float32)
-            normals_array = np.array(normals_list, dtype=np.float32)
-
-            # Center and scale the model
-            center = (vertices_array.max(axis=0) + vertices_array.min(axis=0)) / 2
-            max_size = np.max(vertices_array.max(axis=0) - vertices_array.min(axis=0))
-            scale = 5.0 / max_size if max_size > 0 else 1.0
-            
-            vertices_array = (vertices_array - center) * scale
-            
-            # Make arrays contiguous
-            vertices_array = np.ascontiguousarray(vertices_array, dtype=np.float32)
-            normals_array = np.ascontiguousarray(normals_array, dtype=np.float32)
-
-            # Store the vertex data for later use
-            self.model_vertices = vertices_array
-            self.model_normals = normals_array
-            
-            # Upload vertex data
-            glBindBuffer(GL_ARRAY_BUFFER, self.vbo_vertices.value)
-            glBufferData(GL_ARRAY_BUFFER, vertices_array.nbytes, vertices_array, GL_STATIC_DRAW)
+            # Both go to the GPU as raw memory, and write_model_vertices copies the
+            # interleaved array as one block later on; no-ops for loader output
+            interleaved = np.ascontiguousarray(interleaved)
+            indices = np.ascontiguousarray(indices, dtype=np.uint32)
+            
+            # Store the vertex data for later use; these are views into the interleaved array
+            self.model_interleaved = interleaved
+            self.model_vertices = interleaved['pos']
+            self.model_normals = interleaved['nrm']
+            self.model_indices = indices
+            self._cp_matrix = None
+            self._vertex_kdtree = None
+            self._pressure_vec = None
+            self._streamlines_dirty = True
+            
+            # Bounds for ray picking: the whole model and each triangle
+            tris = self.model_triangles()
+            self._tri_lo = tris.min(axis=1)
+            self._tri_hi = tris.max(axis=1)
+            self.bbox_min = self._tri_lo.min(axis=0)
+            self.bbox_max = self._tri_hi.max(axis=0)
+            # Static properties for the properties panel, fixed until the next load
+            self.model_volume = float(np.prod(self.bbox_max - self.bbox_min))
+            self.model_surface_area = float(_surface_area(tris))
+            
+            # Upload vertex data; keep it mapped for later edits when the driver allows
+            raw = interleaved.view(np.uint8)
+            glBindBuffer(GL_ARRAY_BUFFER, self.vbo_model.value)
+            if bool(glBufferStorage) and bool(glMapBufferRange):
+                glBufferStorage(GL_ARRAY_BUFFER, raw.nbytes, raw, _PERSISTENT_STORAGE_FLAGS)
+                self.vbo_is_immutable = True
+                self._map_vbo(raw.nbytes)
+            else:
+                glBufferData(GL_ARRAY_BUFFER, raw.nbytes, raw, GL_STATIC_DRAW)
+            glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, self.ebo_model.value)
+            glBufferData(GL_ELEMENT_ARRAY_BUFFER, indices.nbytes, indices, GL_STATIC_DRAW)
             
-            # Upload normal data
-            glBindBuffer(GL_ARRAY_BUFFER, self.vbo_normals.value)
-            glBufferData(GL_ARRAY_BUFFER, normals_array.nbytes, normals_array, GL_STATIC_DRAW)
+            if self.vao_model is not None:
+                # Record the client array and index buffer setup once; draw_model just binds the VAO
+                glBindVertexArray(self.vao_model.value)
+                self._bind_model_arrays()
+                glBindVertexArray(0)
             
-            # Unbind buffer
+            # Unbind buffers
             glBindBuffer(GL_ARRAY_BUFFER, 0)
+            glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
             
-            # Update vertex count and model state
-            self.vertex_count = len(vertices_array)
+            # Update counts and model state
+            self.vertex_count = len(interleaved)
+            self.index_count = len(indices)
             self.model_loaded = True
-            self.current_model_path = file_path
             
-            self.logger.info(f"Successfully loaded model with {self.vertex_count} vertices")
-            self.update()
+            self.logger.info(f"Successfully loaded model with {self.vertex_count} vertices, "
+                             f"{self.index_count // 3} triangles")
+            self.request_update()
             
         except Exception as e:
-            self.logger.error(f"Error loading OBJ file: {str(e)}")
+            self.logger.error(f"Error uploading model: {str(e)}")
             self.cleanup()
             raise
 
@@ -852,150 +1827,220 @@ class Viewport(QOpenGLWidget):
             
             if hasattr(self, 'model_loader'):
                 self.model_loader.cleanup_existing_buffers()
-            
+
+            self._release_overlay()
+            if self.vbo_gizmo is not None:
+                glDeleteBuffers(1, [self.vbo_gizmo])
+                self.vbo_gizmo = None
+            if self.vbo_streamlines is not None:
+                glDeleteBuffers(1, [self.vbo_streamlines])
+                self.vbo_streamlines = None
+                self._streamlines_capacity = 0
+            if self.tex_pressure is not None:
+                glDeleteTextures(1, [self.tex_pressure])
+                self.tex_pressure = None
+            if self.vbo_wind_arrows is not None:
+                glDeleteBuffers(1, [self.vbo_wind_arrows])
+                self.vbo_wind_arrows = None
+                self._wind_arrows_capacity = 0
+                self._wind_arrows_dirty = True
+            if self.vao_overlay is not None:
+                glDeleteVertexArrays(1, [self.vao_overlay])
+                self.vao_overlay = None
+            if self.line_program is not None:
+                glDeleteProgram(self.line_program)
+                self.line_program = None
+
         except Exception as e:
             print(f"Warning: Error during cleanup: {str(e)}")
         finally:
             self.doneCurrent()
 
-    def update_pressure_visualization(self, pressure_distribution: Dict[int, float]):
-        """Update the model visualization with pressure data"""
+    def update_pressure_visualization(self, pressure_distribution: np.ndarray):
+        """Update the model visualization with per-vertex pressure data"""
         try:
             if not self.model_loaded:
                 return
 
-            # Create color array based on pressure coefficients
-            colors = np.zeros((len(self.model_vertices), 3), dtype=np.float32)
+            cps = np.asarray(pressure_distribution, dtype=np.float32)[:self.vertex_count]
+            if len(cps) == 0:
+                return
 
-            # Find min and max pressure for better color mapping
-            min_cp = min(pressure_distribution.values())
-            max_cp = max(pressure_distribution.values())
-            cp_range = max_cp - min_cp if max_cp != min_cp else 1.0
+            # The raw cp goes to the GPU; the ramp is applied there
+            self.model_interleaved['cp'][:len(cps)] = cps
+            self.write_model_vertices()
 
-            # Map pressure coefficients to colors using a better color scheme
-            for vertex_id, cp in pressure_distribution.items():
-                # Normalize cp value to 0-1 range
-                normalized_cp = (cp - min_cp) / cp_range
-                
-                # Create a smooth transition from blue (low pressure) to red (high pressure)
-                if normalized_cp < 0.5:
-                    # Blue to white
-                    t = normalized_cp * 2
-                    colors[vertex_id] = [t, t, 1.0]
-                else:
-                    # White to red
-                    t = (normalized_cp - 0.5) * 2
-                    colors[vertex_id] = [1.0, 1.0 - t, 1.0 - t]
-
-            # Create and bind color buffer
-            if not hasattr(self, 'vbo_colors'):
-                self.vbo_colors = GLuint(0)
-                glGenBuffers(1, self.vbo_colors)
-
-            glBindBuffer(GL_ARRAY_BUFFER, self.vbo_colors.value)
-            glBufferData(GL_ARRAY_BUFFER, colors.nbytes, colors, GL_STATIC_DRAW)
+            # Normalize cp to 0-1 using the min and max pressure, then onto the
+            # ramp's texel centres; column-major, so the offset sits in row 3
+            min_cp = float(cps.min())
+            cp_range = float(cps.max()) - min_cp
+            scale = (2.0 / 3.0) / (cp_range if cp_range != 0 else 1.0)
+            cp_matrix = np.identity(4, dtype=np.float32)
+            cp_matrix[0, 0] = scale
+            cp_matrix[3, 0] = 1.0 / 6.0 - min_cp * scale
+            self._cp_matrix = cp_matrix
 
             # Store pressure data for streamline calculation
             self.pressure_data = pressure_distribution
-            self.colors = colors
+            self._pressure_vec = None
+            self._streamlines_dirty = True
 
-            self.update()
+            self.request_update()
 
         except Exception as e:
             print(f"Error updating pressure visualization: {str(e)}")
 
     def draw_streamlines(self):
         """Draw flow streamlines around the model"""
-        if not hasattr(self, 'pressure_data') or not self.model_loaded:
+        if self.pressure_data is None or not self.model_loaded:
             return
 
         try:
-            glDisable(GL_LIGHTING)
+            if self._streamlines_dirty:
+                self._upload_streamlines()
+            if self.streamline_vertex_count == 0:
+                return
+            
             glEnable(GL_BLEND)
             glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
 
-            glLineWidth(1.5)
-            glBegin(GL_LINES)
-
-            # Create streamlines starting points
-            num_streamlines = 50
-            start_points = self.generate_streamline_points(num_streamlines)
-
-            # Draw each streamline
-            for start_point in start_points:
-                points = self.calculate_streamline(start_point)
-                
-                # Draw streamline segments with varying color and alpha
-                for i in range(len(points) - 1):
-                    alpha = 1.0 - (i / len(points))  # Fade out along the streamline
-                    glColor4f(0.5, 0.8, 1.0, alpha * 0.6)  # Light blue with alpha
-                    glVertex3f(*points[i])
-                    glVertex3f(*points[i + 1])
-
-            glEnd()
+            # Streamlines are traced around the untranslated vertices
+            glPushMatrix()
+            glTranslatef(*self.model_position)
+            self._set_line_width(1.5)
+            
+            glBindBuffer(GL_ARRAY_BUFFER, self.vbo_streamlines.value)
+            glInterleavedArrays(GL_C4UB_V3F, 0, ctypes.c_void_p(0))
+            glDrawArrays(GL_LINES, 0, self.streamline_vertex_count)
+            glDisableClientState(GL_COLOR_ARRAY)
+            glDisableClientState(GL_VERTEX_ARRAY)
+            glBindBuffer(GL_ARRAY_BUFFER, 0)
+            
+            glPopMatrix()
             glDisable(GL_BLEND)
-            glEnable(GL_LIGHTING)
 
         except Exception as e:
             print(f"Error drawing streamlines: {str(e)}")
 
-    def generate_streamline_points(self, num_points: int) -> list:
-        """Generate starting points for streamlines"""
-        points = []
-        
-        # Get model bounds
-        vertices = np.array(self.model_vertices).reshape(-1, 3)
-        min_bounds = np.min(vertices, axis=0)
-        max_bounds = np.max(vertices, axis=0)
-        
-        # Generate points in a grid around the model
+    def _build_streamline_array(self, num_streamlines=50):
+        """Trace streamlines into _STREAMLINE_VERTEX line-segment pairs"""
+        segments = []
+        start_points = self.generate_streamline_points(num_streamlines)
+        paths, lengths = self.calculate_streamlines(start_points)
+        for i in range(len(start_points)):
+            points = paths[:lengths[i], i].astype(np.float32)
+            count = len(points) - 1
+            if count <= 0:
+                continue
+            
+            # Each segment is its two endpoints; alpha fades out along the streamline
+            seg = np.zeros(2 * count, dtype=_STREAMLINE_VERTEX)
+            seg['pos'][0::2] = points[:-1]
+            seg['pos'][1::2] = points[1:]
+            alpha = (1.0 - np.arange(count) / len(points)) * 0.6
+            seg['col'][:, :3] = (128, 204, 255)  # Light blue
+            seg['col'][:, 3] = np.repeat(np.rint(alpha * 255), 2)
+            segments.append(seg)
+        if not segments:
+            return np.zeros(0, dtype=_STREAMLINE_VERTEX)
+        return np.concatenate(segments)
+
+    def _upload_streamlines(self):
+        """Retrace the streamlines into their VBO; called from paintGL when they are stale"""
+        streamlines = self._build_streamline_array()
+        if self.vbo_streamlines is None:
+            self.vbo_streamlines = GLuint(0)
+            glGenBuffers(1, self.vbo_streamlines)
+        self._streamlines_capacity = self._stream_to_buffer(
+            self.vbo_streamlines, streamlines, self._streamlines_capacity)
+        self.streamline_vertex_count = len(streamlines)
+        self._streamlines_dirty = False
+
+    def generate_streamline_points(self, num_points: int) -> np.ndarray:
+        """Generate (num_points, 3) starting points for streamlines"""
+        # Random points in the model bounds (cached at upload) plus a margin
         margin = 2.0  # Distance from model
-        for i in range(num_points):
-            x = np.random.uniform(min_bounds[0] - margin, max_bounds[0] + margin)
-            y = np.random.uniform(min_bounds[1] - margin, max_bounds[1] + margin)
-            z = np.random.uniform(min_bounds[2] - margin, max_bounds[2] + margin)
-            points.append(np.array([x, y, z]))
-        
-        return points
+        return np.random.uniform(self.bbox_min - margin, self.bbox_max + margin,
+                                 size=(num_points, 3))
 
     def calculate_streamline(self, start_point: np.ndarray) -> list:
         """Calculate streamline path from starting point"""
-        points = [start_point]
-        max_steps = 50
-        step_size = 0.1
-        
-        for _ in range(max_steps):
-            current_point = points[-1]
-            velocity = self.calculate_velocity_at_point(current_point)
-            
-            if np.all(velocity == 0):
+        paths, lengths = self.calculate_streamlines([start_point])
+        return list(paths[:lengths[0], 0])
+
+    def calculate_streamlines(self, start_points, max_steps=50, step_size=0.1):
+        """Advance all streamlines together; returns (max_steps + 1, S, 3) positions
+        and the number of points in each streamline"""
+        paths = np.zeros((max_steps + 1, len(start_points), 3))
+        paths[0] = np.asarray(start_points, dtype=np.float64).reshape(-1, 3)
+        lengths = np.ones(len(start_points), dtype=np.int64)
+        pressure = self._pressure_array()
+        active = np.arange(len(start_points))
+        
+        for step in range(1, max_steps + 1):
+            points = paths[step - 1, active]
+            if _advance_streamlines_jit is not None:
+                moved = np.empty_like(points)
+                moving = np.empty(len(points), dtype=np.bool_)
+                _advance_streamlines_jit(points, self._nearest_vertices(points), self.model_vertices,
+                                         pressure, step_size, moved, moving)
+                moved = moved[moving]
+            else:
+                velocity = self._flow_velocity(points, pressure)
+                # A streamline stops where the velocity vanishes
+                moving = np.any(velocity != 0, axis=1)
+                velocity = velocity[moving]
+                # Normalize velocity and scale by step size
+                speed = np.linalg.norm(velocity, axis=1, keepdims=True)
+                moved = points[moving] + velocity / speed * step_size
+            
+            active = active[moving]
+            if len(active) == 0:
                 break
-            
-            # Normalize velocity and scale by step size
-            velocity = velocity / np.linalg.norm(velocity) * step_size
-            next_point = current_point + velocity
-            points.append(next_point)
-        
-        return points
+            paths[step, active] = moved
+            lengths[active] += 1
+        
+        return paths, lengths
+
+    def _vertex_tree(self):
+        """KD-tree over the model vertices, built on first use after each upload"""
+        if self._vertex_kdtree is None:
+            from scipy.spatial import cKDTree
+            self._vertex_kdtree = cKDTree(self.model_vertices)
+        return self._vertex_kdtree
+
+    def _pressure_array(self):
+        """Per-vertex pressure from pressure_data, 0 where a vertex has none;
+        cached until the pressure data or model changes"""
+        if self._pressure_vec is not None:
+            return self._pressure_vec
+        pressure = np.zeros(len(self.model_vertices))
+        cps = self.pressure_data[:len(pressure)]
+        pressure[:len(cps)] = cps
+        self._pressure_vec = pressure
+        return pressure
+
+    def _nearest_vertices(self, points, k=4):
+        """Indices of the k nearest model vertices to each of (S, 3) points, (S, k)"""
+        k = min(k, len(self.model_vertices))
+        _, nearest = self._vertex_tree().query(points, k=k)
+        return nearest.reshape(len(points), k)
+
+    def _flow_velocity(self, points, pressure):
+        """Velocity at each of (S, 3) points: directions to the 4 nearest vertices
+        weighted by their pressure"""
+        nearest = self._nearest_vertices(points)
+        direction = self.model_vertices[nearest] - points[:, None, :]
+        # A vertex the point sits on has no direction and adds nothing
+        length = np.linalg.norm(direction, axis=2, keepdims=True)
+        np.divide(direction, length, out=direction, where=length > 0)
+        return np.einsum('skd,sk->sd', direction, pressure[nearest])
 
     def calculate_velocity_at_point(self, point: np.ndarray) -> np.ndarray:
         """Calculate velocity vector at a given point"""
-        # Simple velocity field calculation based on pressure gradient
-        velocity = np.zeros(3)
-        
-        # Find nearest vertices and interpolate velocity
-        vertices = np.array(self.model_vertices).reshape(-1, 3)
-        distances = np.linalg.norm(vertices - point, axis=1)
-        nearest_indices = np.argsort(distances)[:4]  # Use 4 nearest points
-        
-        for idx in nearest_indices:
-            if idx in self.pressure_data:
-                pressure = self.pressure_data[idx]
-                direction = vertices[idx] - point
-                direction = direction / np.linalg.norm(direction)
-                velocity += direction * pressure
-        
-        return velocity
+        # Simple velocity field based on the pressure at the 4 nearest vertices
+        point = np.asarray(point, dtype=np.float64).reshape(1, 3)
+        return self._flow_velocity(point, self._pressure_array())[0]
 
     def create_wind_plate(self):
         """Create a wind source plate in the viewport"""
@@ -1017,7 +2062,7 @@ class Viewport(QOpenGLWidget):
 
     def draw_wind_plate(self):
         """Draw the wind source plate"""
-        if not hasattr(self, 'wind_plate'):
+        if self.wind_plate is None:
             return
         
         try:
@@ -1037,7 +2082,6 @@ class Viewport(QOpenGLWidget):
             glEnable(GL_BLEND)
             glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
             
-            glDisable(GL_LIGHTING)
             glColor4f(0.2, 0.6, 1.0, 0.3)  # Light blue, semi-transparent
             
             # Draw plate
@@ -1056,7 +2100,6 @@ class Viewport(QOpenGLWidget):
             # Draw wind direction arrows
             self.draw_wind_arrows()
             
-            glEnable(GL_LIGHTING)
             glDisable(GL_BLEND)
             
             glPopMatrix()
@@ -1066,32 +2109,23 @@ class Viewport(QOpenGLWidget):
 
     def draw_wind_arrows(self):
         """Draw arrows showing wind direction"""
-        arrow_count = 5
-        arrow_length = 1.0
+        arrows = self.wind_plate['arrows']
+        if self._wind_arrows_dirty:
+            # Geometry only changes with the plate size
+            if self.vbo_wind_arrows is None:
+                self.vbo_wind_arrows = GLuint(0)
+                glGenBuffers(1, self.vbo_wind_arrows)
+            self._wind_arrows_capacity = self._stream_to_buffer(
+                self.vbo_wind_arrows, arrows, self._wind_arrows_capacity)
+            self._wind_arrows_dirty = False
         
         glColor4f(0.2, 0.6, 1.0, 0.8)
-        glBegin(GL_LINES)
-        
-        width = self.wind_plate['size'][0]
-        height = self.wind_plate['size'][1]
-        
-        for i in range(arrow_count):
-            for j in range(arrow_count):
-                # Calculate start position
-                x = (i / (arrow_count - 1) - 0.5) * width
-                y = (j / (arrow_count - 1) - 0.5) * height
-                
-                # Draw arrow body
-                glVertex3f(x, y, 0)
-                glVertex3f(x, y, arrow_length)
-                
-                # Draw arrow head
-                glVertex3f(x, y, arrow_length)
-                glVertex3f(x - 0.1, y, arrow_length - 0.2)
-                glVertex3f(x, y, arrow_length)
-                glVertex3f(x + 0.1, y, arrow_length - 0.2)
-                
-        glEnd()
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo_wind_arrows.value)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glVertexPointer(3, GL_FLOAT, 0, ctypes.c_void_p(0))
+        glDrawArrays(GL_LINES, 0, len(arrows))
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
 
     def create_simple_wind_plate(self, width, height):
         """Create a simple wind plate"""
@@ -1112,18 +2146,20 @@ class Viewport(QOpenGLWidget):
                 'vertices': vertices,
                 'indices': indices,
                 'size': np.array([width, height]),
+                'arrows': _wind_arrows(width, height),
                 'position': np.array([0.0, 0.0, -5.0]),  # Add position
                 'rotation': {'x': 0.0, 'y': 0.0, 'z': 0.0}  # Add rotation
             }
             
-            self.update()
+            self._wind_arrows_dirty = True
+            self.request_update()
             
         except Exception as e:
             print(f"Error creating wind plate: {str(e)}")
 
     def update_wind_transform(self):
         """Update wind plate transform based on UI controls"""
-        if not hasattr(self, 'wind_plate'):
+        if self.wind_plate is None:
             return
         
         try:
@@ -1141,7 +2177,7 @@ class Viewport(QOpenGLWidget):
                 'z': self.wind_rot_z.value()
             }
             
-            self.update()
+            self.request_update()
             
         except Exception as e:
             print(f"Error updating wind transform: {str(e)}")
@@ -1152,29 +2188,16 @@ class Viewport(QOpenGLWidget):
             return
         
         try:
-            vertices = np.array(self.model_vertices).reshape(-1, 3)
-            
-            # Calculate volume (approximate using bounding box)
-            min_bounds = np.min(vertices, axis=0)
-            max_bounds = np.max(vertices, axis=0)
-            dimensions = max_bounds - min_bounds
-            volume = np.prod(dimensions)
-            
-            # Calculate surface area (approximate using triangles)
-            surface_area = 0
-            for i in range(0, len(vertices), 3):
-                if i + 2 < len(vertices):
-                    v1, v2, v3 = vertices[i:i+3]
-                    # Calculate triangle area
-                    area = np.linalg.norm(np.cross(v2-v1, v3-v1)) / 2
-                    surface_area += area
+            # Volume (bounding box) and surface area (triangles), computed at upload
+            volume = self.model_volume
+            surface_area = self.model_surface_area
             
             # Update labels
             self.volume_label.setText(f"{volume:.3f} m³")
             self.surface_area_label.setText(f"{surface_area:.3f} m²")
             
             # Calculate mass based on density and volume
-            mass = volume * self.density_input.value()
+            mass = volume * self.material_density_input.value()
             self.mass_input.setValue(mass)
             
         except Exception as e:
@@ -1182,7 +2205,7 @@ class Viewport(QOpenGLWidget):
 
     def draw_wind_plate_gizmos(self):
         """Draw transform gizmos for the wind plate"""
-        if not hasattr(self, 'wind_plate'):
+        if self.wind_plate is None:
             return
         
         try:
@@ -1197,48 +2220,10 @@ class Viewport(QOpenGLWidget):
             glRotatef(rot['z'], 0, 0, 1)
             
             # Draw transform axes
-            glDisable(GL_LIGHTING)
-            glLineWidth(2.0)
+            self._set_line_width(2.0)
             
-            axis_length = 2.0
+            self.draw_gizmo_axes()
             
-            # X axis (red)
-            glBegin(GL_LINES)
-            glColor3f(1, 0, 0)
-            glVertex3f(0, 0, 0)
-            glVertex3f(axis_length, 0, 0)
-            # Arrow head
-            glVertex3f(axis_length, 0, 0)
-            glVertex3f(axis_length - 0.2, 0.1, 0)
-            glVertex3f(axis_length, 0, 0)
-            glVertex3f(axis_length - 0.2, -0.1, 0)
-            glEnd()
-            
-            # Y axis (green)
-            glBegin(GL_LINES)
-            glColor3f(0, 1, 0)
-            glVertex3f(0, 0, 0)
-            glVertex3f(0, axis_length, 0)
-            # Arrow head
-            glVertex3f(0, axis_length, 0)
-            glVertex3f(0.1, axis_length - 0.2, 0)
-            glVertex3f(0, axis_length, 0)
-            glVertex3f(-0.1, axis_length - 0.2, 0)
-            glEnd()
-            
-            # Z axis (blue)
-            glBegin(GL_LINES)
-            glColor3f(0, 0, 1)
-            glVertex3f(0, 0, 0)
-            glVertex3f(0, 0, axis_length)
-            # Arrow head
-            glVertex3f(0, 0, axis_length)
-            glVertex3f(0.1, 0, axis_length - 0.2)
-            glVertex3f(0, 0, axis_length)
-            glVertex3f(-0.1, 0, axis_length - 0.2)
-            glEnd()
-            
-            glEnable(GL_LIGHTING)
             glPopMatrix()
             
         except Exception as e:
@@ -1249,75 +2234,87 @@ class Viewport(QOpenGLWidget):
         # Convert mouse position to ray
         ray_start, ray_dir = self.get_ray_from_mouse(mouse_pos)
         
-        if not hasattr(self, 'wind_plate'):
+        if self.wind_plate is None:
             return None
         
         # Get wind plate position
         pos = self.wind_plate['position']
         
-        # Check distance to each axis
-        axes = {
-            'x': (np.array([1, 0, 0]), (1, 0, 0)),
-            'y': (np.array([0, 1, 0]), (0, 1, 0)),
-            'z': (np.array([0, 0, 1]), (0, 0, 1))
-        }
-        
-        closest_axis = None
-        min_distance = 0.1  # Threshold for selection
-        
-        for axis_name, (axis_dir, color) in axes.items():
-            distance = self.point_line_distance(
-                ray_start, ray_dir,
-                pos,
-                pos + axis_dir * 2.0
-            )
-            if distance < min_distance:
-                min_distance = distance
-                closest_axis = axis_name
-            
-        return closest_axis
+        return self._pick_gizmo_axis(ray_start, ray_dir, pos)
 
     def get_ray_from_mouse(self, mouse_pos):
         """Convert mouse position to 3D ray"""
-        viewport = glGetIntegerv(GL_VIEWPORT)
-        modelview = glGetDoublev(GL_MODELVIEW_MATRIX)
-        projection = glGetDoublev(GL_PROJECTION_MATRIX)
+        # Unproject with the cached camera matrices instead of querying GL state
+        if self._mv_dirty:
+            self._rebuild_mv()
+        inverse = np.linalg.inv(self._proj.T.astype(np.float64) @ self._mv.T.astype(np.float64))
         
-        mouse_x = mouse_pos.x()
-        mouse_y = viewport[3] - mouse_pos.y()
+        # Widget coordinates to normalized device coordinates
+        x = 2.0 * mouse_pos.x() / max(self.width(), 1) - 1.0
+        y = 1.0 - 2.0 * mouse_pos.y() / max(self.height(), 1)
         
-        near = gluUnProject(mouse_x, mouse_y, 0.0, modelview, projection, viewport)
-        far = gluUnProject(mouse_x, mouse_y, 1.0, modelview, projection, viewport)
+        near = inverse @ np.array([x, y, -1.0, 1.0])
+        far = inverse @ np.array([x, y, 1.0, 1.0])
         
-        ray_start = np.array(near)
-        ray_dir = np.array(far) - ray_start
+        ray_start = near[:3] / near[3]
+        ray_dir = far[:3] / far[3] - ray_start
         ray_dir = ray_dir / np.linalg.norm(ray_dir)
         
         return ray_start, ray_dir
 
     def point_line_distance(self, ray_start, ray_dir, line_start, line_end):
-        """Calculate distance from a point to a line segment"""
+        """Calculate the shortest distance between the ray's line and the line
+        through line_start and line_end; inf if they are parallel"""
         line_dir = line_end - line_start
-        line_length = np.linalg.norm(line_dir)
-        line_dir = line_dir / line_length
         
+        # |(p2 - p1) . (d1 x d2)| / |d1 x d2|
         cross = np.cross(ray_dir, line_dir)
-        return np.abs(np.dot(cross, (line_start - ray_start)))
+        cross_length = np.linalg.norm(cross)
+        if cross_length == 0:
+            return np.inf
+        return np.abs(np.dot(cross, (line_start - ray_start))) / cross_length
 
     def reset_view(self):
         """Reset camera to default position"""
         self.rotation = [30, 45, 0]
         self.zoom = 15.0
         self.pan_offset = [0.0, 0.0]
-        self.update()
+        self._mv_dirty = True
+        self.request_update()
 
 class EditorWindow(QMainWindow):
     def __init__(self, project_path):
         super().__init__()
         self.project_path = project_path
         self.settings = QSettings('AeroCalculator', 'Editor')
+        # Settings are read and written through an in-memory cache; changed keys
+        # reach QSettings in one batch once edits settle, or on close
+        self._settings_cache = {}
+        self._settings_dirty = set()
+        self._settings_flush = QTimer(self)
+        self._settings_flush.setSingleShot(True)
+        self._settings_flush.setInterval(2000)
+        self._settings_flush.timeout.connect(self._flush_settings)
         self.dock_widgets = {}  # Store references to dock widgets
         
+        # Flow parameter edits are coalesced into one recompute after scrubbing stops
+        self._forces_calculated = False
+        # (vertices, conditions, forces) of the last calculation
+        self._force_cache = (None, None, None)
+        self._calc_debounce = QTimer(self)
+        self._calc_debounce.setSingleShot(True)
+        self._calc_debounce.setInterval(200)
+        self._calc_debounce.timeout.connect(self._recompute_forces)
+        
+        # Wind spinbox edits in one event loop pass collapse into a single transform update
+        self._wind_update = QTimer(self)
+        self._wind_update.setSingleShot(True)
+        self._wind_update.setInterval(0)
+        self._wind_update.timeout.connect(self._apply_wind_transform)
+        
+        if _triangulate_jit is not None:
+            QThreadPool.globalInstance().start(TriangulateWarmup())
+        
         # Set minimum sizes for the window and dock widgets
         self.setMinimumSize(1200, 800)
         
@@ -1338,40 +2335,7 @@ class EditorWindow(QMainWindow):
         self.setMinimumSize(1200, 800)
         
         # Set the style
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #1e1e1e;
-            }
-            QDockWidget {
-                color: white;
-                font-size: 14px;
-            }
-            QDockWidget::title {
-                background: #2d2d2d;
-                padding: 8px;
-                border: 1px solid #3d3d3d;
-            }
-            QLabel {
-                color: white;
-                font-size: 13px;
-                padding: 4px;
-            }
-            QTreeWidget {
-                background-color: #2d2d2d;
-                color: white;
-                border: 1px solid #3d3d3d;
-                font-size: 13px;
-            }
-            QTreeWidget::item {
-                padding: 4px;
-            }
-            QTreeWidget::item:selected {
-                background-color: #0078d4;
-            }
-            QWidget {
-                background-color: #252526;
-            }
-        """)
+        self.setStyleSheet(_EDITOR_QSS)
         
         # Create central widget with OpenGL viewport
         self.viewport = Viewport()
@@ -1382,77 +2346,7 @@ class EditorWindow(QMainWindow):
         toolbar.setObjectName("viewportControls")  # Add object name
         toolbar.setFloatable(True)
         toolbar.setMovable(True)
-        toolbar.setStyleSheet("""
-            QToolBar {
-                background-color: rgba(45, 45, 45, 200);
-                border: 1px solid #3d3d3d;
-                border-radius: 6px;
-                padding: 6px;
-                spacing: 4px;
-            }
-            QToolButton {
-                color: white;
-                background-color: rgba(60, 60, 60, 180);
-                border: 1px solid #3d3d3d;
-                padding: 6px 12px;
-                border-radius: 4px;
-                min-width: 60px;
-                font-size: 12px;
-                font-weight: 500;
-            }
-            QToolButton:hover {
-                background-color: rgba(70, 70, 70, 180);
-                border: 1px solid rgba(255, 255, 255, 30);
-            }
-            QToolButton:checked {
-                background-color: rgba(0, 120, 212, 180);
-                border: 1px solid rgba(255, 255, 255, 40);
-            }
-            QToolButton::menu-indicator {
-                image: none;
-            }
-            QDoubleSpinBox {
-                background-color: rgba(60, 60, 60, 180);
-                color: white;
-                border: 1px solid #3d3d3d;
-                border-radius: 4px;
-                padding: 4px 8px;
-                min-width: 70px;
-                font-size: 12px;
-                selection-background-color: #0078d4;
-            }
-            QDoubleSpinBox:hover {
-                background-color: rgba(70, 70, 70, 180);
-                border: 1px solid rgba(255, 255, 255, 30);
-            }
-            QDoubleSpinBox::up-button, QDoubleSpinBox::down-button {
-                border: none;
-                background: transparent;
-                width: 16px;
-            }
-            QDoubleSpinBox::up-button:hover, QDoubleSpinBox::down-button:hover {
-                background-color: rgba(255, 255, 255, 20);
-            }
-            QMenu {
-                background-color: rgba(45, 45, 45, 230);
-                color: white;
-                border: 1px solid #3d3d3d;
-                border-radius: 4px;
-                padding: 4px;
-            }
-            QMenu::item {
-                padding: 6px 28px 6px 12px;
-                border-radius: 2px;
-            }
-            QMenu::item:selected {
-                background-color: rgba(0, 120, 212, 180);
-            }
-            QMenu::separator {
-                height: 1px;
-                background: #3d3d3d;
-                margin: 4px 8px;
-            }
-        """)
+        toolbar.setStyleSheet(_TOOLBAR_QSS)
 
         # Create a widget for grid controls
         grid_widget = QWidget()
@@ -1559,35 +2453,11 @@ class EditorWindow(QMainWindow):
                                   QDockWidget.DockWidgetFeature.DockWidgetFloatable |
                                   QDockWidget.DockWidgetFeature.DockWidgetClosable)
         self.dock_widgets["properties"] = properties_dock
-        
-        properties_widget = QWidget()
-        properties_layout = QVBoxLayout(properties_widget)
-        properties_layout.setContentsMargins(10, 10, 10, 10)
-        properties_layout.setSpacing(8)
-        
-        # Add some sample properties
-        title_label = QLabel("Model Properties")
-        title_label.setFont(QFont("Arial", 14, QFont.Weight.Bold))
-        properties_layout.addWidget(title_label)
-        
-        # Add some placeholder properties
-        properties_layout.addWidget(QLabel("Dimensions"))
-        properties_layout.addWidget(QLabel("Material"))
-        properties_layout.addWidget(QLabel("Mass"))
-        properties_layout.addStretch()
-        
-        properties_dock.setWidget(properties_widget)
+        self.build_properties_panel(properties_dock)
         self.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea, properties_dock)
         
         # Status bar
-        self.statusBar().setStyleSheet("""
-            QStatusBar {
-                color: white;
-                background-color: #2d2d2d;
-                padding: 4px;
-                font-size: 13px;
-            }
-        """)
+        self.statusBar().setStyleSheet(_STATUSBAR_QSS)
         self.statusBar().showMessage("Ready - Drag and drop 3D models to import") 
         
         # Add transform mode button to toolbar
@@ -1601,11 +2471,11 @@ class EditorWindow(QMainWindow):
 
     def toggle_grid(self, state):
         self.viewport.show_grid = state
-        self.viewport.update()
+        self.viewport.request_update()
         
     def toggle_axes(self, state):
         self.viewport.show_axes = state
-        self.viewport.update()
+        self.viewport.request_update()
         
     def show_dock_widget(self, widget_name):
         """Show the specified dock widget if it exists."""
@@ -1613,91 +2483,170 @@ class EditorWindow(QMainWindow):
             self.dock_widgets[widget_name].show()
             self.dock_widgets[widget_name].raise_()
         
+    def _settings_spinboxes(self):
+        """Physics panel spinboxes by settings key; empty until the panel is built"""
+        if self.density_spin is None:
+            return {}
+        return {
+            'density': self.density_spin,
+            'velocity': self.velocity_spin,
+            'temperature': self.temperature_spin,
+            'aoa': self.aoa_spin,
+            'wind_size_x': self.wind_size_x,
+            'wind_size_y': self.wind_size_y,
+            'wind_pos_x': self.wind_pos_x,
+            'wind_pos_y': self.wind_pos_y,
+            'wind_pos_z': self.wind_pos_z,
+            'wind_rot_x': self.wind_rot_x,
+            'wind_rot_y': self.wind_rot_y,
+            'wind_rot_z': self.wind_rot_z,
+        }
+
+    def _set_setting(self, key, value):
+        """Update a setting in the cache; it is written out on the next flush"""
+        if key in self._settings_cache and self._settings_cache[key] == value:
+            return
+        self._settings_cache[key] = value
+        self._settings_dirty.add(key)
+        self._settings_flush.start()
+
+    def _flush_settings(self):
+        """Write the settings changed since the last flush in one batch"""
+        if not self._settings_dirty:
+            return
+        self.settings.beginGroup('editor')
+        try:
+            for key in self._settings_dirty:
+                self.settings.setValue(key, self._settings_cache[key])
+        finally:
+            self.settings.endGroup()
+        self._settings_dirty.clear()
+        self.settings.sync()
+
     def saveSettings(self):
         """Save application settings"""
         try:
-            # Save window state and geometry
-            self.settings.setValue('geometry', self.saveGeometry())
-            self.settings.setValue('windowState', self.saveState())
-            
-            # Save physics panel values
-            if hasattr(self, 'density_input'):
-                self.settings.setValue('density', self.density_input.findChild(QDoubleSpinBox).value())
-            if hasattr(self, 'velocity_input'):
-                self.settings.setValue('velocity', self.velocity_input.findChild(QDoubleSpinBox).value())
-            if hasattr(self, 'temperature_input'):
-                self.settings.setValue('temperature', self.temperature_input.findChild(QDoubleSpinBox).value())
-            if hasattr(self, 'aoa_input'):
-                self.settings.setValue('aoa', self.aoa_input.findChild(QDoubleSpinBox).value())
-            
-            # Save wind plate settings if it exists
-            if hasattr(self, 'wind_size_x'):
-                self.settings.setValue('wind_size_x', self.wind_size_x.value())
-                self.settings.setValue('wind_size_y', self.wind_size_y.value())
-                self.settings.setValue('wind_pos_x', self.wind_pos_x.value())
-                self.settings.setValue('wind_pos_y', self.wind_pos_y.value())
-                self.settings.setValue('wind_pos_z', self.wind_pos_z.value())
-                self.settings.setValue('wind_rot_x', self.wind_rot_x.value())
-                self.settings.setValue('wind_rot_y', self.wind_rot_y.value())
-                self.settings.setValue('wind_rot_z', self.wind_rot_z.value())
-            
-            # Save physics panel visibility and position
+            # Physics panel and wind plate values
+            values = {key: spinbox.value() for key, spinbox in self._settings_spinboxes().items()}
+            
+            # Window state and geometry
+            values['geometry'] = self.saveGeometry()
+            values['windowState'] = self.saveState()
+            
+            # Physics panel visibility and position
             if 'physics' in self.dock_widgets:
                 physics_dock = self.dock_widgets['physics']
-                self.settings.setValue('physicsPanelVisible', physics_dock.isVisible())
-                self.settings.setValue('physicsPanelFloating', physics_dock.isFloating())
+                values['physicsPanelVisible'] = physics_dock.isVisible()
+                values['physicsPanelFloating'] = physics_dock.isFloating()
                 if physics_dock.isFloating():
-                    self.settings.setValue('physicsPanelPos', physics_dock.pos())
+                    values['physicsPanelPos'] = physics_dock.pos()
+            
+            # Unchanged values are skipped; flush now rather than on the timer
+            for key, value in values.items():
+                self._set_setting(key, value)
+            self._settings_flush.stop()
+            self._flush_settings()
             
         except Exception as e:
             print(f"Error saving settings: {str(e)}")
 
+    def _read_settings(self):
+        """Fill the settings cache from the 'editor' group, first moving keys
+        saved at the root by older versions into it"""
+        self.settings.beginGroup('editor')
+        try:
+            migrate = not self.settings.childKeys()
+        finally:
+            self.settings.endGroup()
+        if migrate:
+            legacy = {key: self.settings.value(key) for key in _LEGACY_SETTINGS_KEYS
+                      if self.settings.contains(key)}
+            if legacy:
+                self.settings.beginGroup('editor')
+                try:
+                    for key, value in legacy.items():
+                        self.settings.setValue(key, value)
+                finally:
+                    self.settings.endGroup()
+                for key in legacy:
+                    self.settings.remove(key)
+                self.settings.sync()
+        
+        self.settings.beginGroup('editor')
+        try:
+            # Read every stored value once up front; later reads hit the cache
+            for key in self.settings.childKeys():
+                self._settings_cache[key] = self.settings.value(key)
+        finally:
+            self.settings.endGroup()
+
     def loadSettings(self):
         """Load application settings"""
         try:
+            self._read_settings()
+            vals = self._settings_cache
+            
             # Restore window state and geometry
-            if self.settings.value('geometry'):
-                self.restoreGeometry(self.settings.value('geometry'))
-            if self.settings.value('windowState'):
-                self.restoreState(self.settings.value('windowState'))
-            
-            # Restore physics panel values
-            if hasattr(self, 'density_input') and self.settings.contains('density'):
-                self.density_input.findChild(QDoubleSpinBox).setValue(float(self.settings.value('density')))
-            if hasattr(self, 'velocity_input') and self.settings.contains('velocity'):
-                self.velocity_input.findChild(QDoubleSpinBox).setValue(float(self.settings.value('velocity')))
-            if hasattr(self, 'temperature_input') and self.settings.contains('temperature'):
-                self.temperature_input.findChild(QDoubleSpinBox).setValue(float(self.settings.value('temperature')))
-            if hasattr(self, 'aoa_input') and self.settings.contains('aoa'):
-                self.aoa_input.findChild(QDoubleSpinBox).setValue(float(self.settings.value('aoa')))
-            
-            # Restore wind plate settings
-            if hasattr(self, 'wind_size_x') and self.settings.contains('wind_size_x'):
-                self.wind_size_x.setValue(float(self.settings.value('wind_size_x')))
-                self.wind_size_y.setValue(float(self.settings.value('wind_size_y')))
-                self.wind_pos_x.setValue(float(self.settings.value('wind_pos_x')))
-                self.wind_pos_y.setValue(float(self.settings.value('wind_pos_y')))
-                self.wind_pos_z.setValue(float(self.settings.value('wind_pos_z')))
-                self.wind_rot_x.setValue(float(self.settings.value('wind_rot_x')))
-                self.wind_rot_y.setValue(float(self.settings.value('wind_rot_y')))
-                self.wind_rot_z.setValue(float(self.settings.value('wind_rot_z')))
-                
-                # Recreate wind plate with saved settings
-                self.create_wind_plate()
+            if vals.get('geometry'):
+                self.restoreGeometry(vals['geometry'])
+            if vals.get('windowState'):
+                self.restoreState(vals['windowState'])
+            
+            # Panel widgets pick these up once they are built
+            self._physics_settings = vals
+            if self.density_spin is not None:
+                self.apply_physics_settings()
+            elif 'wind_size_x' in vals:
+                # Restore the wind plate straight into the viewport
+                self.viewport.create_simple_wind_plate(float(vals['wind_size_x']),
+                                                       float(vals['wind_size_y']))
+                self.viewport.wind_plate['position'] = np.array([
+                    float(vals['wind_pos_x']),
+                    float(vals['wind_pos_y']),
+                    float(vals['wind_pos_z'])
+                ])
+                self.viewport.wind_plate['rotation'] = {
+                    'x': float(vals['wind_rot_x']),
+                    'y': float(vals['wind_rot_y']),
+                    'z': float(vals['wind_rot_z'])
+                }
             
             # Restore physics panel visibility and position
             if 'physics' in self.dock_widgets:
                 physics_dock = self.dock_widgets['physics']
-                if self.settings.contains('physicsPanelVisible'):
-                    physics_dock.setVisible(self.settings.value('physicsPanelVisible', True, type=bool))
-                if self.settings.contains('physicsPanelFloating'):
-                    physics_dock.setFloating(self.settings.value('physicsPanelFloating', False, type=bool))
-                if physics_dock.isFloating() and self.settings.contains('physicsPanelPos'):
-                    physics_dock.move(self.settings.value('physicsPanelPos'))
+                if 'physicsPanelVisible' in vals:
+                    physics_dock.setVisible(_to_bool(vals['physicsPanelVisible']))
+                if 'physicsPanelFloating' in vals:
+                    physics_dock.setFloating(_to_bool(vals['physicsPanelFloating']))
+                if physics_dock.isFloating() and 'physicsPanelPos' in vals:
+                    physics_dock.move(vals['physicsPanelPos'])
             
         except Exception as e:
             print(f"Error loading settings: {str(e)}")
 
+    def apply_physics_settings(self):
+        """Apply stored settings to the physics panel widgets"""
+        vals = self._physics_settings
+        spinboxes = self._settings_spinboxes()
+        try:
+            # Restore physics panel and wind plate values without firing valueChanged
+            # for each one; the wind plate is rebuilt once afterwards
+            blockers = [QSignalBlocker(spinbox) for spinbox in spinboxes.values()]
+            try:
+                for key, spinbox in spinboxes.items():
+                    if key in vals:
+                        spinbox.setValue(float(vals[key]))
+            finally:
+                for blocker in blockers:
+                    blocker.unblock()
+
+            # Recreate wind plate with saved settings
+            if spinboxes and 'wind_size_x' in vals:
+                self.create_wind_plate()
+
+        except Exception as e:
+            print(f"Error applying physics settings: {str(e)}")
+
     def closeEvent(self, event):
         try:
             # Save settings and state before closing
@@ -1748,30 +2697,42 @@ class EditorWindow(QMainWindow):
         models_item.setExpanded(True)
 
     def setup_physics_panel(self):
-        """Create physics control panel"""
+        """Create physics control panel dock; its contents are built on first show"""
         physics_dock = QDockWidget("Physics Controls", self)
         physics_dock.setObjectName("physicsPanel")
         physics_dock.setMinimumWidth(300)  # Set minimum width
+        physics_dock.setWidget(QWidget())
+        physics_dock.setProperty('built', False)
+        physics_dock.visibilityChanged.connect(self.on_physics_panel_visibility)
+        
+        # Panel widgets don't exist until the dock is first shown
+        self.density_spin = None
+        self.velocity_spin = None
+        self.temperature_spin = None
+        self.aoa_spin = None
+        self.wind_size_x = None
+        self.calc_button = None
+        self._physics_settings = {}
         
+        self.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea, physics_dock)
+        self.dock_widgets["physics"] = physics_dock
+
+    def on_physics_panel_visibility(self, visible):
+        """Build the physics panel contents the first time the dock is shown"""
+        physics_dock = self.dock_widgets["physics"]
+        if visible and not physics_dock.property('built'):
+            physics_dock.setProperty('built', True)
+            self.build_physics_panel(physics_dock)
+            self.apply_physics_settings()
+
+    def build_physics_panel(self, physics_dock):
+        """Create physics control panel widgets"""
         # Create a scroll area
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
         scroll.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        scroll.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background-color: transparent;
-            }
-            QScrollBar:vertical {
-                background-color: #2d2d2d;
-                width: 12px;
-            }
-            QScrollBar:horizontal {
-                background-color: #2d2d2d;
-                height: 12px;
-            }
-        """)
+        scroll.setStyleSheet(_SCROLL_QSS)
         
         # Create the main widget that will be scrollable
         physics_widget = QWidget()
@@ -1786,10 +2747,17 @@ class EditorWindow(QMainWindow):
         self.velocity_input = self.create_parameter_input("Velocity (m/s):", 100.0)
         self.temperature_input = self.create_parameter_input("Temperature (°C):", 20.0)
         self.aoa_input = self.create_parameter_input("Angle of Attack (°):", 0.0)
+        self.density_spin = self.density_input.spinbox
+        self.velocity_spin = self.velocity_input.spinbox
+        self.temperature_spin = self.temperature_input.spinbox
+        self.aoa_spin = self.aoa_input.spinbox
         flow_layout.addWidget(self.density_input)
         flow_layout.addWidget(self.velocity_input)
         flow_layout.addWidget(self.temperature_input)
         flow_layout.addWidget(self.aoa_input)
+        for spinbox in (self.density_spin, self.velocity_spin,
+                        self.temperature_spin, self.aoa_spin):
+            spinbox.valueChanged.connect(lambda _: self._calc_debounce.start())
         flow_group.setLayout(flow_layout)
         
         # Wind Source Group
@@ -1899,11 +2867,13 @@ class EditorWindow(QMainWindow):
         
         for widget in physics_widget.findChildren(QGroupBox):
             widget.setMinimumWidth(280)
+        
+        # Edits go to the settings cache right away and reach disk on the next flush
+        for key, spinbox in self._settings_spinboxes().items():
+            spinbox.valueChanged.connect(lambda value, key=key: self._set_setting(key, value))
             
         scroll.setWidget(physics_widget)
         physics_dock.setWidget(scroll)
-        self.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea, physics_dock)
-        self.dock_widgets["physics"] = physics_dock
 
     def create_parameter_input(self, label: str, default_value: float) -> QWidget:
         """Create a labeled parameter input widget"""
@@ -1920,6 +2890,8 @@ class EditorWindow(QMainWindow):
         layout.addWidget(label_widget)
         layout.addWidget(spinbox)
         widget.setLayout(layout)
+        # Kept on the widget so callers don't have to findChild() it
+        widget.spinbox = spinbox
         return widget
 
     def calculate_aerodynamics(self):
@@ -1931,11 +2903,11 @@ class EditorWindow(QMainWindow):
 
             # Get current flow conditions
             conditions = FlowConditions(
-                density=self.density_input.findChild(QDoubleSpinBox).value(),
-                velocity=self.velocity_input.findChild(QDoubleSpinBox).value(),
-                temperature=self.temperature_input.findChild(QDoubleSpinBox).value(),
+                density=self.density_spin.value(),
+                velocity=self.velocity_spin.value(),
+                temperature=self.temperature_spin.value(),
                 viscosity=1.81e-5,  # Standard air viscosity at 20°C
-                angle_of_attack=self.aoa_input.findChild(QDoubleSpinBox).value()
+                angle_of_attack=self.aoa_spin.value()
             )
 
             # Calculate forces
@@ -1949,39 +2921,51 @@ class EditorWindow(QMainWindow):
 
             # Update visualization
             self.viewport.update_pressure_visualization(forces.pressure_distribution)
+            self._forces_calculated = True
 
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Calculation failed: {str(e)}")
 
+    def _recompute_forces(self):
+        """Refresh the results after flow parameters change, once forces have been calculated"""
+        if self._forces_calculated and self.viewport.model_loaded:
+            self.calculate_aerodynamics()
+
     def calculate_forces(self, conditions: FlowConditions) -> AerodynamicForces:
         """Calculate aerodynamic forces"""
         try:
             if not self.viewport.model_loaded:
                 raise RuntimeError("No model loaded")
 
-            # Get vertices directly from the viewport's loaded model data
-            vertices = np.array(self.viewport.model_vertices, dtype=np.float32).reshape(-1, 3)
+            # Use the viewport's (N, 3) float32 vertex view directly, no copy
+            vertices = self.viewport.model_vertices
             if len(vertices) == 0:
                 raise RuntimeError("Model has no vertices")
 
+            # Same model and flow conditions as last time: reuse the result.
+            # A reload replaces the vertex view, so identity tracks the model
+            cached_vertices, cached_conditions, cached_forces = self._force_cache
+            if cached_vertices is vertices and cached_conditions == conditions:
+                return cached_forces
+
             # Print debug info
             print(f"Number of vertices: {len(vertices)}")
             print(f"Vertex array shape: {vertices.shape}")
             
-            # Calculate reference area (simplified - use bounding box)
-            x_coords = vertices[:, 0]
-            y_coords = vertices[:, 1]
-            reference_area = abs((max(x_coords) - min(x_coords)) * (max(y_coords) - min(y_coords)))
+            # Calculate reference area (simplified - use the bounding box cached at upload)
+            extent = self.viewport.bbox_max - self.viewport.bbox_min
+            reference_area = abs(float(extent[0]) * float(extent[1]))
             print(f"Reference area: {reference_area}")
 
             # Calculate dynamic pressure
             q_inf = 0.5 * conditions.density * conditions.velocity ** 2
 
-            # Simple force calculation based on angle of attack
-            alpha = np.radians(conditions.angle_of_attack)
+            # Simple force calculation based on angle of attack; all scalars,
+            # so plain float math rather than 0-d numpy values
+            alpha = math.radians(conditions.angle_of_attack)
 
             # Basic lift and drag coefficients (simplified)
-            cl = 2 * np.pi * alpha  # Simplified thin airfoil theory
+            cl = math.tau * alpha  # Simplified thin airfoil theory, 2*pi*alpha
             cd = 0.1 + 0.1 * alpha * alpha  # Simplified drag polar
 
             # Calculate forces
@@ -1989,21 +2973,18 @@ class EditorWindow(QMainWindow):
             drag = q_inf * reference_area * cd
             moment = -0.25 * lift  # Simplified moment calculation
 
-            # Generate simplified pressure distribution
-            pressure_dist = {}
-            for i in range(len(vertices)):
-                # Simple pressure distribution based on height
-                y_pos = vertices[i][1]  # Y coordinate
-                cp = -2 * y_pos / reference_area
-                pressure_dist[i] = cp
+            # Generate simplified pressure distribution, based on height (Y)
+            pressure_dist = -2 * vertices[:, 1] / reference_area
 
-            return AerodynamicForces(
+            forces = AerodynamicForces(
                 lift=float(lift),
                 drag=float(drag),
                 moment=float(moment),
                 pressure_distribution=pressure_dist,
                 cp=float(cl)
             )
+            self._force_cache = (vertices, conditions, forces)
+            return forces
 
         except Exception as e:
             print(f"Debug - Calculation error: {str(e)}")
@@ -2048,25 +3029,16 @@ class EditorWindow(QMainWindow):
 
     def update_properties_panel(self, model_name=None):
         """Update the properties panel with model information"""
-        if "properties" not in self.dock_widgets:
-            return
-            
-        properties_dock = self.dock_widgets["properties"]
+        self.properties_name_label.setText(model_name if model_name else "No Model Loaded")
+
+    def build_properties_panel(self, properties_dock):
+        """Create the properties panel widgets once; model loads only update them"""
         properties_dock.setMinimumWidth(250)  # Set minimum width
         
         # Create a scroll area for properties
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("""
-            QScrollArea {
-                border: none;
-                background-color: transparent;
-            }
-            QScrollBar:vertical {
-                background-color: #2d2d2d;
-                width: 12px;
-            }
-        """)
+        scroll.setStyleSheet(_SCROLL_QSS)
         
         properties_widget = QWidget()
         layout = QVBoxLayout(properties_widget)
@@ -2078,8 +3050,8 @@ class EditorWindow(QMainWindow):
         model_layout = QFormLayout()
 
         # Model name
-        name_label = QLabel(model_name if model_name else "No Model Loaded")
-        model_layout.addRow("Name:", name_label)
+        self.properties_name_label = QLabel("No Model Loaded")
+        model_layout.addRow("Name:", self.properties_name_label)
 
         # Physical properties with input fields
         self.mass_input = QDoubleSpinBox()
@@ -2088,11 +3060,11 @@ class EditorWindow(QMainWindow):
         self.mass_input.setSuffix(" kg")
         model_layout.addRow("Mass:", self.mass_input)
 
-        self.density_input = QDoubleSpinBox()
-        self.density_input.setRange(1, 20000)
-        self.density_input.setValue(2700)  # Default aluminum density
-        self.density_input.setSuffix(" kg/m³")
-        model_layout.addRow("Material Density:", self.density_input)
+        self.material_density_input = QDoubleSpinBox()
+        self.material_density_input.setRange(1, 20000)
+        self.material_density_input.setValue(2700)  # Default aluminum density
+        self.material_density_input.setSuffix(" kg/m³")
+        model_layout.addRow("Material Density:", self.material_density_input)
 
         # Material type dropdown
         self.material_type = QComboBox()
@@ -2130,14 +3102,18 @@ class EditorWindow(QMainWindow):
             "Aluminum": 2700,
             "Steel": 7850,
             "Plastic": 1200,
-            "Custom": self.density_input.value()
+            "Custom": self.material_density_input.value()
         }
         if material in densities:
-            self.density_input.setValue(densities[material])
+            self.material_density_input.setValue(densities[material])
 
     def update_wind_transform(self):
+        """Schedule a wind plate transform update from the UI controls"""
+        self._wind_update.start()
+
+    def _apply_wind_transform(self):
         """Update wind plate transform based on UI controls"""
-        if not hasattr(self.viewport, 'wind_plate'):
+        if self.viewport.wind_plate is None:
             return
         
         try:
@@ -2155,7 +3131,7 @@ class EditorWindow(QMainWindow):
                 'z': self.wind_rot_z.value()
             }
             
-            self.viewport.update()
+            self.viewport.request_update()
             
         except Exception as e:
             print(f"Error updating wind transform: {str(e)}")
@@ -2166,29 +3142,16 @@ class EditorWindow(QMainWindow):
             return
         
         try:
-            vertices = np.array(self.viewport.model_vertices).reshape(-1, 3)
-            
-            # Calculate volume (approximate using bounding box)
-            min_bounds = np.min(vertices, axis=0)
-            max_bounds = np.max(vertices, axis=0)
-            dimensions = max_bounds - min_bounds
-            volume = np.prod(dimensions)
-            
-            # Calculate surface area (approximate using triangles)
-            surface_area = 0
-            for i in range(0, len(vertices), 3):
-                if i + 2 < len(vertices):
-                    v1, v2, v3 = vertices[i:i+3]
-                    # Calculate triangle area
-                    area = np.linalg.norm(np.cross(v2-v1, v3-v1)) / 2
-                    surface_area += area
+            # Volume (bounding box) and surface area (triangles), computed at upload
+            volume = self.viewport.model_volume
+            surface_area = self.viewport.model_surface_area
             
             # Update labels
             self.volume_label.setText(f"{volume:.3f} m³")
             self.surface_area_label.setText(f"{surface_area:.3f} m²")
             
             # Calculate mass based on density and volume
-            mass = volume * self.density_input.value()
+            mass = volume * self.material_density_input.value()
             self.mass_input.setValue(mass)
             
         except Exception as e:
@@ -2196,7 +3159,7 @@ class EditorWindow(QMainWindow):
 
     def update_transform_ui(self):
         """Update transform UI controls with current wind plate transform"""
-        if not hasattr(self.viewport, 'wind_plate'):
+        if self.viewport.wind_plate is None or self.wind_size_x is None:
             return
         
         # Update position spinboxes
@@ -2217,4 +3180,4 @@ class EditorWindow(QMainWindow):
         if not checked:
             self.viewport.selected_object = None
             self.viewport.selected_axis = None
-        self.viewport.update()
\ No newline at end of file
+        self.viewport.request_update()
\ No newline at end of file
@@ -11,7 +11,7 @@ from editor_window import EditorWindow
 from OpenGL.GL import glGetString
 import numpy as np
 from dataclasses import dataclass
-from typing import Dict, Tuple, List
+from typing import Tuple, List
 
 # Store stuff uhhh yes vewy cool
 PROJECTS_DIR = os.path.expanduser("~/AeroProjects")
@@ -31,7 +31,7 @@ class AerodynamicForces:
     lift: float  # Lift force (N)
     drag: float  # Drag force (N)
     moment: float  # Pitching moment (N·m)
-    pressure_distribution: Dict[int, float]  # Pressure at each vertex
+    pressure_distribution: np.ndarray  # Pressure coefficient at each vertex, by index
     cp: float  # Pressure coefficient
 
 class AeroPhysicsEngine:
@@ -79,13 +79,8 @@ class AeroPhysicsEngine:
             drag = q_inf * reference_area * cd
             moment = -0.25 * lift  #moment calc
             
-            #pressure distrubution
-            pressure_dist = {}
-            for i in range(len(self.vertices)):
-                #pressure distribution based on cordinate
-                y_pos = self.vertices[i][1]  # Y coordinate
-                cp = -2 * y_pos / reference_area
-                pressure_dist[i] = cp
+            #pressure distrubution based on Y cordinate
+            pressure_dist = -2 * self.vertices[:, 1] / reference_area
             
             return AerodynamicForces(
                 lift=float(lift),
@@ -605,6 +600,8 @@ class MainWindow(QMainWindow):
             raise RuntimeError("VBO extension not available")
 
 def main():
+    # Editor viewports share GL objects such as the grid VBO
+    QApplication.setAttribute(Qt.ApplicationAttribute.AA_ShareOpenGLContexts)
     app = QApplication(sys.argv)
     main_window = MainWindow()
     main_window.show()
@@ -0,0 +1,66 @@
+"""OBJ face parsing: the numba byte scanner and the numpy fallback must agree."""
+import logging
+
+import numpy as np
+import pytest
+
+pytest.importorskip("PyQt6.QtOpenGLWidgets")
+pytest.importorskip("OpenGL.GL")
+numba_kernels = pytest.importorskip("aero_obj_numba")
+editor_window = pytest.importorskip("editor_window")
+
+if numba_kernels.scan_faces is None:
+    pytest.skip("numba is not available", allow_module_level=True)
+
+FACE_LINES = [
+    b'f 1 2 3',
+    b'f 1/4 2/5 3/6 4/7',
+    b'f 1//2 2//3 3//1',
+    b'f 3/1/2 4/2/3 5/3/1',
+    b'f -1 -2 -3',
+    b'f -3//-1 -2//-2 -1//-3',
+    b'f\t2/1/1\t3/2/2  4/3/3\r',
+]
+
+
+def _scan(monkeypatch, kernel, lines):
+    monkeypatch.setattr(editor_window, '_scan_faces_jit', kernel)
+    return editor_window._scan_obj_faces(lines)
+
+
+def test_scan_faces_matches_numpy(monkeypatch, caplog):
+    expected = _scan(monkeypatch, None, FACE_LINES)
+    with caplog.at_level(logging.WARNING, logger='AeroCalculator'):
+        scanned = _scan(monkeypatch, numba_kernels.scan_faces, FACE_LINES)
+    # A warning means the kernel raised and the numpy path ran instead
+    assert not caplog.records
+    for jit_array, numpy_array in zip(scanned, expected):
+        np.testing.assert_array_equal(jit_array, numpy_array)
+
+
+@pytest.mark.parametrize('line', [b'f 1 2 9', b'f -4 -2 -1', b'f 0 1 2', b'f 1//1 2//2 3//5'])
+def test_out_of_range_face_is_rejected(line):
+    with pytest.raises(ValueError):
+        editor_window._parse_obj_faces([line], 3, 3)
+
+
+def test_scan_faces_stops_when_output_is_full(monkeypatch):
+    buf = np.frombuffer(bytearray(b'f 1 2 3'), dtype=np.uint8)
+    raw = np.empty(2, dtype=np.int32)
+    counts = np.empty(1, dtype=np.int32)
+    assert numba_kernels.scan_faces(buf, raw, raw.copy(), counts) == -1
+    # '\r' separates tokens without being counted as whitespace; numpy takes over
+    lines = [b'f 1\r2\r3']
+    expected = _scan(monkeypatch, None, lines)
+    for jit_array, numpy_array in zip(_scan(monkeypatch, numba_kernels.scan_faces, lines), expected):
+        np.testing.assert_array_equal(jit_array, numpy_array)
+
+
+def test_tab_separated_records_load():
+    spaced = b'v 0 0 0\nv 1 0 0\nv 0 1 0\nvn 0 0 1\nf 1//1 2//1 3//1\n'
+    tabbed = b'v\t0 0 0\n  v\t1\t0\t0\nv 0 1 0\nvn\t0\t0\t1\n\tf\t1//1\t2//1 3//1\n'
+    expected = editor_window._parse_obj(spaced)
+    parsed = editor_window._parse_obj(tabbed)
+    assert len(parsed[0]) == 3
+    for parsed_array, expected_array in zip(parsed, expected):
+        np.testing.assert_array_equal(parsed_array, expected_array)
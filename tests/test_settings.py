@@ -0,0 +1,54 @@
+"""Settings: values saved at the root by older versions move into the 'editor' group."""
+from types import SimpleNamespace
+
+import pytest
+
+QtCore = pytest.importorskip("PyQt6.QtCore")
+editor_window = pytest.importorskip("editor_window")
+
+QSettings = QtCore.QSettings
+EditorWindow = editor_window.EditorWindow
+
+
+def _settings(path):
+    return QSettings(str(path), QSettings.Format.IniFormat)
+
+
+def _read(path):
+    window = SimpleNamespace(settings=_settings(path), _settings_cache={})
+    EditorWindow._read_settings(window)
+    return window._settings_cache
+
+
+def test_root_keys_are_migrated(tmp_path):
+    path = tmp_path / "editor.ini"
+    legacy = _settings(path)
+    legacy.setValue('geometry', QtCore.QByteArray(b'\x01\x02geometry'))
+    legacy.setValue('density', 1.5)
+    legacy.setValue('wind_pos_x', -3.0)
+    legacy.setValue('physicsPanelVisible', False)
+    legacy.sync()
+    del legacy
+
+    cache = _read(path)
+    assert bytes(cache['geometry']) == b'\x01\x02geometry'
+    assert float(cache['density']) == 1.5
+    assert float(cache['wind_pos_x']) == -3.0
+    assert editor_window._to_bool(cache['physicsPanelVisible']) is False
+
+    # Rewritten under the group and gone from the root, so it happens once
+    stored = _settings(path)
+    assert float(stored.value('editor/density')) == 1.5
+    assert not stored.contains('density')
+    assert float(_read(path)['density']) == 1.5
+
+
+def test_existing_group_wins_over_root_keys(tmp_path):
+    path = tmp_path / "editor.ini"
+    stored = _settings(path)
+    stored.setValue('density', 1.5)
+    stored.setValue('editor/density', 2.5)
+    stored.sync()
+    del stored
+
+    assert float(_read(path)['density']) == 2.5
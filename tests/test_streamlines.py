@@ -0,0 +1,66 @@
+"""Streamline tracing: the numba kernel and the numpy fallback must agree."""
+import numpy as np
+import pytest
+
+pytest.importorskip("scipy")
+pytest.importorskip("PyQt6.QtOpenGLWidgets")
+pytest.importorskip("OpenGL.GL")
+numba_kernels = pytest.importorskip("aero_obj_numba")
+editor_window = pytest.importorskip("editor_window")
+
+if numba_kernels.advance_streamlines is None:
+    pytest.skip("numba is not available", allow_module_level=True)
+
+Viewport = editor_window.Viewport
+
+
+class _Flow:
+    """Just the viewport state and methods the streamline tracer uses"""
+    calculate_streamlines = Viewport.calculate_streamlines
+    _nearest_vertices = Viewport._nearest_vertices
+    _flow_velocity = Viewport._flow_velocity
+    _pressure_array = Viewport._pressure_array
+    _vertex_tree = Viewport._vertex_tree
+
+    def __init__(self, positions, pressure):
+        # A strided view into interleaved records, like an uploaded model
+        records = np.zeros(len(positions), dtype=editor_window._MODEL_VERTEX)
+        records['pos'] = positions
+        self.model_vertices = records['pos']
+        self.pressure_data = np.asarray(pressure, dtype=np.float32)
+        self._vertex_kdtree = None
+        self._pressure_vec = None
+
+
+def _trace(monkeypatch, kernel, positions, pressure, start_points):
+    monkeypatch.setattr(editor_window, '_advance_streamlines_jit', kernel)
+    return _Flow(positions, pressure).calculate_streamlines(start_points)
+
+
+def _assert_same(monkeypatch, positions, pressure, start_points):
+    paths_np, lengths_np = _trace(monkeypatch, None, positions, pressure, start_points)
+    paths_jit, lengths_jit = _trace(monkeypatch, numba_kernels.advance_streamlines,
+                                    positions, pressure, start_points)
+    np.testing.assert_array_equal(lengths_jit, lengths_np)
+    for i, length in enumerate(lengths_np):
+        np.testing.assert_allclose(paths_jit[:length, i], paths_np[:length, i],
+                                   rtol=1e-9, atol=1e-12)
+    return paths_np, lengths_np
+
+
+def test_random_seeds_match(monkeypatch):
+    rng = np.random.default_rng(0)
+    positions = rng.normal(size=(300, 3)).astype(np.float32)
+    pressure = np.linspace(-1.0, 1.0, len(positions))
+    _assert_same(monkeypatch, positions, pressure, rng.uniform(-3, 3, size=(40, 3)))
+
+
+def test_seed_on_vertex_matches(monkeypatch):
+    rng = np.random.default_rng(1)
+    positions = rng.normal(size=(50, 3)).astype(np.float32)
+    pressure = np.linspace(-1.0, 1.0, len(positions))
+    # Seeds exactly on mesh vertices, plus one ordinary seed
+    start_points = np.vstack([positions[[0, 7, 21]].astype(np.float64), [[2.0, 2.0, 2.0]]])
+    paths, lengths = _assert_same(monkeypatch, positions, pressure, start_points)
+    for i, length in enumerate(lengths):
+        assert np.isfinite(paths[:length, i]).all()